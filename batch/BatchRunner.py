@@ -0,0 +1,117 @@
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, TextIO
+
+from dotenv import load_dotenv
+
+from enums.AgentPurpose import AgentPurpose
+from enums.AiProvider import AiProvider
+from enums.SimulationStatus import SimulationStatus
+from state.HearingConfig import HearingConfig
+
+
+def _init_worker(concurrency_limits: Dict[AiProvider, Any]) -> None:
+    load_dotenv()
+
+    from crew.LlmClientPool import LlmClientPool
+
+    for provider, semaphore in concurrency_limits.items():
+        LlmClientPool().set_concurrency_limit(provider, semaphore)
+
+
+def _run_case(case_id: str, config: HearingConfig, hearing_id: str, resume: bool) -> Dict[str, Any]:
+    from crew.Hearing import HearingFactory
+    from simulation.Simulation import Simulation
+
+    simulation = Simulation()
+    simulation.set_status(SimulationStatus.RUNNING)
+    jury_verdict = None
+    started_at = time.time()
+    try:
+        hearing = HearingFactory().get_hearing(config, simulation, hearing_id, resume)
+        hearing.run()
+        jury_verdict = hearing.jury_verdict
+        simulation.set_status(SimulationStatus.FINISHED)
+    except Exception as e:
+        simulation.set_status(SimulationStatus.FAILED, str(e))
+    finally:
+        duration = time.time() - started_at
+        simulation.run_finish_callbacks()
+
+    judge_messages = simulation.get_messages(AgentPurpose.JUDGE)
+
+    return {
+        'case': case_id,
+        'hearing_id': hearing_id,
+        'court_type': config.court_type.value,
+        'config_hash': config.config_hash(),
+        'status': simulation.status.value,
+        'error': simulation.error,
+        'verdict': judge_messages[-1] if judge_messages else None,
+        'jury_verdict': jury_verdict.verdict.value if jury_verdict is not None else None,
+        'jury_votes': [vote.dict() for vote in jury_verdict.votes] if jury_verdict is not None else [],
+        'duration': duration
+    }
+
+
+class BatchRunner:
+    def __init__(self,
+                 settings: Dict[str, Any],
+                 max_workers: Optional[int] = None,
+                 run_id: Optional[str] = None,
+                 resume: bool = False
+                 ) -> None:
+        self.settings = settings
+        self.max_workers = max_workers or int(os.getenv('BATCH_MAX_WORKERS', os.cpu_count() or 1))
+        self.run_id = run_id or str(uuid.uuid4())
+        self.resume = resume
+
+    def run(self, cases: List[Dict[str, str]], output: TextIO) -> Dict[str, int]:
+        counts = {status.value: 0 for status in (SimulationStatus.FINISHED, SimulationStatus.FAILED)}
+
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker,
+                                 initargs=(self._get_concurrency_limits(),)) as executor:
+            futures = [
+                executor.submit(_run_case, case['id'], self._get_config(case), f'batch:{self.run_id}:{index}', self.resume)
+                for index, case in enumerate(cases)
+            ]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    counts[result['status']] += 1
+                    output.write(json.dumps(result) + '\n')
+                    output.flush()
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return counts
+
+    def _get_config(self, case: Dict[str, str]) -> HearingConfig:
+        overrides = {'case_description': case['description']}
+        if 'court_type' in case:
+            overrides['court_type'] = case['court_type']
+        if 'hearing_script' in case:
+            overrides['hearing_script'] = case['hearing_script']
+
+        return HearingConfig.from_settings(self.settings, **overrides)
+
+    @staticmethod
+    def _get_concurrency_limits() -> Dict[AiProvider, Any]:
+        return {
+            provider: multiprocessing.get_context('spawn').BoundedSemaphore(
+                int(os.getenv(f'BATCH_MAX_CONCURRENCY_{provider.name}', 4))
+            )
+            for provider in AiProvider
+        }
+
+    @staticmethod
+    def load_settings(path: str) -> Dict[str, Any]:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
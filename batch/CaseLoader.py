@@ -0,0 +1,31 @@
+import json
+import os
+from typing import Dict, List
+
+
+class CaseLoader:
+    @staticmethod
+    def load(path: str) -> List[Dict[str, str]]:
+        if os.path.isdir(path):
+            return CaseLoader._load_directory(path)
+        return CaseLoader._load_jsonl(path)
+
+    @staticmethod
+    def _load_directory(path: str) -> List[Dict[str, str]]:
+        cases = []
+        for file_name in sorted(os.listdir(path)):
+            case_id, extension = os.path.splitext(file_name)
+            if extension not in ('.txt', '.md'):
+                continue
+            with open(os.path.join(path, file_name), encoding='utf-8') as file:
+                cases.append({'id': case_id, 'description': file.read().strip()})
+        return cases
+
+    @staticmethod
+    def _load_jsonl(path: str) -> List[Dict[str, str]]:
+        with open(path, encoding='utf-8') as file:
+            cases = [json.loads(line) for line in file if line.strip()]
+
+        for index, case in enumerate(cases, start=1):
+            case.setdefault('id', str(index))
+        return cases
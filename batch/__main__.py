@@ -0,0 +1,36 @@
+import argparse
+import json
+import sys
+
+from dotenv import load_dotenv
+
+from batch.BatchRunner import BatchRunner
+from batch.CaseLoader import CaseLoader
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m batch', description='Run many court hearings without Streamlit.')
+    parser.add_argument('--settings', required=True)
+    parser.add_argument('--cases', required=True)
+    parser.add_argument('--output', required=True)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--run-id', default=None)
+    parser.add_argument('--resume', action='store_true')
+    args = parser.parse_args()
+    if args.resume and args.run_id is None:
+        parser.error('--resume requires --run-id')
+
+    load_dotenv()
+
+    runner = BatchRunner(BatchRunner.load_settings(args.settings), args.workers, args.run_id, args.resume)
+    print(f'Batch run {runner.run_id}', file=sys.stderr)
+    cases = CaseLoader.load(args.cases)
+
+    with open(args.output, 'a', encoding='utf-8') as output:
+        counts = runner.run(cases, output)
+
+    print(json.dumps(counts), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
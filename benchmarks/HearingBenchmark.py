@@ -0,0 +1,104 @@
+import math
+import os
+import platform
+import subprocess
+import time
+from typing import Any, Dict, List
+
+from crew.Hearing import HearingFactory
+from crew.LlmClientPool import LlmClientPool
+from enums.CourtCaseType import CourtCaseType
+from enums.SimulationStatus import SimulationStatus
+from simulation.Simulation import Simulation
+from state.HearingConfig import HearingConfig
+
+
+class HearingBenchmark:
+    def __init__(self,
+                 settings: Dict[str, Any],
+                 cases: List[Dict[str, str]],
+                 court_types: List[CourtCaseType],
+                 repetitions: int = 1
+                 ) -> None:
+        self.settings = settings
+        self.cases = cases
+        self.court_types = court_types
+        self.repetitions = repetitions
+
+    def run(self) -> Dict[str, Any]:
+        runs = []
+        for court_type in self.court_types:
+            for case in self.cases:
+                for repetition in range(1, self.repetitions + 1):
+                    runs.append(self._run_hearing(court_type, case, repetition))
+
+        return {
+            'commit': self._get_commit(),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'scheduler': os.getenv('HEARING_SCHEDULER', 'plan'),
+            'settings': {key: value for key, value in self.settings.items() if not key.endswith('_key')},
+            'summary': {
+                court_type.value: self._summarize([run for run in runs if run['court_type'] == court_type.value])
+                for court_type in self.court_types
+            },
+            'rate_limiters': LlmClientPool().get_rate_limiter_stats(),
+            'runs': runs
+        }
+
+    def _run_hearing(self, court_type: CourtCaseType, case: Dict[str, str], repetition: int) -> Dict[str, Any]:
+        config = HearingConfig.from_settings(self.settings, court_type=court_type, case_description=case['description'])
+
+        simulation = Simulation()
+        simulation.set_status(SimulationStatus.RUNNING)
+        started_at = time.time()
+        try:
+            HearingFactory().get_hearing(config, simulation).run()
+            simulation.set_status(SimulationStatus.FINISHED)
+        except Exception as e:
+            simulation.set_status(SimulationStatus.FAILED, str(e))
+        finally:
+            total = time.time() - started_at
+            simulation.run_finish_callbacks()
+
+        return {
+            'case': case['id'],
+            'court_type': court_type.value,
+            'repetition': repetition,
+            'config_hash': config.config_hash(),
+            'status': simulation.status.value,
+            'error': simulation.error,
+            'total': total,
+            **simulation.metrics.to_dict()
+        }
+
+    def _summarize(self, runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        totals = sorted(run['total'] for run in runs if run['status'] == SimulationStatus.FINISHED.value)
+
+        return {
+            'runs': len(runs),
+            'failed': len(runs) - len(totals),
+            'p50': self._percentile(totals, 50),
+            'p95': self._percentile(totals, 95),
+            'p99': self._percentile(totals, 99),
+            'llm_calls': sum(run['llm_calls'] for run in runs),
+            'prompt_tokens': sum(run['prompt_tokens'] for run in runs),
+            'completion_tokens': sum(run['completion_tokens'] for run in runs),
+            'cached_tokens': sum(run['cached_tokens'] for run in runs),
+            'cost': sum(run['cost'] for run in runs)
+        }
+
+    @staticmethod
+    def _percentile(values: List[float], percentile: int) -> float | None:
+        if not values:
+            return None
+        return values[max(0, math.ceil(percentile / 100 * len(values)) - 1)]
+
+    @staticmethod
+    def _get_commit() -> str | None:
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
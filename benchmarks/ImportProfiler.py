@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from textwrap import dedent
+from typing import Any, Dict, List
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = ['Home.py', 'pages/Settings.py', 'pages/Court.py']
+HEAVY_PACKAGES = [
+    'crewai', 'langchain_core', 'langchain_openai', 'langchain_anthropic', 'langchain_community',
+    'openai', 'anthropic', 'chromadb'
+]
+MARKER = '--- profiled ---'
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+
+class ImportProfiler:
+    def __init__(self, pages: List[str], modules: List[str], top: int = 15) -> None:
+        self.pages = pages
+        self.modules = modules
+        self.top = top
+
+    def run(self) -> Dict[str, Any]:
+        profiles = [self._profile('page', page, f'AppTest.from_file({page!r}, default_timeout=60).run()') for page in self.pages]
+        profiles += [self._profile('module', module, f'import {module}') for module in self.modules]
+
+        return {
+            'timestamp': time.time(),
+            'python': sys.version.split()[0],
+            'profiles': profiles
+        }
+
+    def _profile(self, kind: str, target: str, statement: str) -> Dict[str, Any]:
+        code = dedent(f'''
+        import json, sys, time
+        from streamlit.testing.v1 import AppTest
+        sys.stderr.write({MARKER!r} + '\\n')
+        sys.stderr.flush()
+        started_at = time.perf_counter()
+        {statement}
+        print(json.dumps({{
+            'seconds': time.perf_counter() - started_at,
+            'heavy_packages': [package for package in {HEAVY_PACKAGES!r} if package in sys.modules]
+        }}))
+        ''')
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=PROJECT_DIR,
+            capture_output=True,
+            text=True,
+            env={**os.environ, 'PYTHONPATH': PROJECT_DIR}
+        )
+        if process.returncode != 0:
+            return {'kind': kind, 'target': target, 'error': process.stderr.strip().splitlines()[-1:]}
+
+        imports = []
+        for line in process.stderr.split(MARKER, 1)[-1].splitlines():
+            match = IMPORT_TIME_LINE.match(line)
+            if match is not None and len(match.group(3)) == 1:
+                imports.append({'module': match.group(4), 'cumulative_ms': int(match.group(2)) / 1000})
+
+        return {
+            'kind': kind,
+            'target': target,
+            **json.loads(process.stdout.strip().splitlines()[-1]),
+            'imports_ms': round(sum(item['cumulative_ms'] for item in imports), 1),
+            'slowest_imports': sorted(imports, key=lambda item: item['cumulative_ms'], reverse=True)[:self.top]
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.ImportProfiler',
+                                     description='Profile import time of the app pages and modules.')
+    parser.add_argument('--page', nargs='+', default=PAGES)
+    parser.add_argument('--module', nargs='*', default=['crew.Hearing'])
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--output', default=os.path.join(PROJECT_DIR, 'benchmarks', 'results'))
+    args = parser.parse_args()
+
+    results = ImportProfiler(args.page, args.module, args.top).run()
+
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f'{time.strftime("%Y%m%d-%H%M%S")}-imports.json')
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+    for profile in results['profiles']:
+        if 'error' in profile:
+            print(f'{profile["target"]}: failed {profile["error"]}')
+            continue
+
+        print(f'{profile["target"]}: {profile["seconds"]:.2f}s, imports {profile["imports_ms"]:.0f}ms, '
+              f'LLM stack: {", ".join(profile["heavy_packages"]) or "not loaded"}')
+        for item in profile['slowest_imports'][:5]:
+            print(f'    {item["cumulative_ms"]:8.1f}ms  {item["module"]}')
+    print(f'Results written to {path}')
+
+
+if __name__ == '__main__':
+    main()
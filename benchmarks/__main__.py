@@ -0,0 +1,53 @@
+import argparse
+import json
+import os
+import time
+
+from dotenv import load_dotenv
+
+from enums.CourtCaseType import CourtCaseType
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run headless court hearing benchmarks.')
+    parser.add_argument('--settings', default=os.path.join(BENCHMARKS_DIR, 'settings.fake.json'))
+    parser.add_argument('--cases', default=os.path.join(BENCHMARKS_DIR, 'cases.jsonl'))
+    parser.add_argument('--court-type', nargs='+', default=CourtCaseType.get_all(), choices=CourtCaseType.get_all())
+    parser.add_argument('--repetitions', type=int, default=1)
+    parser.add_argument('--limit', type=int, default=None)
+    parser.add_argument('--use-cache', action='store_true')
+    parser.add_argument('--output', default=os.path.join(BENCHMARKS_DIR, 'results'))
+    args = parser.parse_args()
+
+    load_dotenv()
+    if not args.use_cache:
+        os.environ['LLM_CACHE_BACKEND'] = 'none'
+    os.environ['CHECKPOINTS_ENABLED'] = 'false'
+    os.environ['PRECEDENTS_ENABLED'] = 'false'
+    os.environ['MEMORY_EMBEDDINGS'] = 'none'
+
+    from batch.BatchRunner import BatchRunner
+    from batch.CaseLoader import CaseLoader
+    from benchmarks.HearingBenchmark import HearingBenchmark
+
+    benchmark = HearingBenchmark(
+        settings=BatchRunner.load_settings(args.settings),
+        cases=CaseLoader.load(args.cases)[:args.limit],
+        court_types=[CourtCaseType.get_by_name(court_type) for court_type in args.court_type],
+        repetitions=args.repetitions
+    )
+    results = benchmark.run()
+
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f'{time.strftime("%Y%m%d-%H%M%S")}-{(results["commit"] or "unknown")[:8]}.json')
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+    print(json.dumps(results['summary'], indent=2))
+    print(f'Results written to {path}')
+
+
+if __name__ == '__main__':
+    main()
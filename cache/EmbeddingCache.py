@@ -0,0 +1,69 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, List
+
+from state.SingletonMeta import SingletonMeta
+
+
+class EmbeddingCache(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        database_path = os.getenv('EMBEDDING_CACHE_PATH', './storage/embedding_cache.sqlite')
+        directory = os.path.dirname(database_path)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    key TEXT PRIMARY KEY,
+                    embedding BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            ''')
+
+    def get_many(self, model: str, texts: List[str]) -> Dict[str, List[float]]:
+        keys = {self._get_key(model, text): text for text in texts}
+        with self._lock:
+            rows = []
+            key_list = list(keys)
+            for start in range(0, len(key_list), 500):
+                batch = key_list[start:start + 500]
+                rows.extend(self._connection.execute(
+                    f'SELECT key, embedding FROM embedding_cache WHERE key IN ({",".join("?" * len(batch))})', batch
+                ).fetchall())
+            self.hits += len(rows)
+            self.misses += len(keys) - len(rows)
+
+        return {keys[key]: array('f', embedding).tolist() for key, embedding in rows}
+
+    def set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        created_at = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO embedding_cache (key, embedding, created_at) VALUES (?, ?, ?)',
+                [
+                    (self._get_key(model, text), array('f', embedding).tobytes(), created_at)
+                    for text, embedding in embeddings.items()
+                ]
+            )
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': self._connection.execute('SELECT COUNT(*) FROM embedding_cache').fetchone()[0]
+            }
+
+    @staticmethod
+    def _get_key(model: str, text: str) -> str:
+        return hashlib.sha256(f'{model}:{text}'.encode('utf-8')).hexdigest()
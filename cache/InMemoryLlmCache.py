@@ -0,0 +1,43 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from langchain_core.caches import RETURN_VAL_TYPE
+
+from cache.LlmCache import LlmCache
+
+
+class InMemoryLlmCache(LlmCache):
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        super().__init__(max_entries, ttl)
+        self._entries: OrderedDict[str, Tuple[RETURN_VAL_TYPE, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str) -> Tuple[RETURN_VAL_TYPE, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, value: RETURN_VAL_TYPE, created_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, created_at)
+            self._entries.move_to_end(key)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _evict(self) -> None:
+        with self._lock:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _count(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,71 @@
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+
+
+class LlmCache(BaseCache, ABC):
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = self._get_key(prompt, llm_string)
+        entry = self._get(key)
+
+        if entry is not None and self._is_expired(entry[1]):
+            self._delete(key)
+            entry = None
+
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entry[0]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self._set(self._get_key(prompt, llm_string), return_val, time.time())
+        self._evict()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': self._count()
+            }
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl > 0 and time.time() - created_at > self.ttl
+
+    @staticmethod
+    def _get_key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f'{llm_string}---{prompt}'.encode('utf-8')).hexdigest()
+
+    @abstractmethod
+    def _get(self, key: str) -> Tuple[RETURN_VAL_TYPE, float] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _set(self, key: str, value: RETURN_VAL_TYPE, created_at: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _evict(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _count(self) -> int:
+        raise NotImplementedError
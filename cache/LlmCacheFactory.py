@@ -0,0 +1,42 @@
+import os
+import threading
+
+from cache.InMemoryLlmCache import InMemoryLlmCache
+from cache.LlmCache import LlmCache
+from cache.SqliteLlmCache import SqliteLlmCache
+from enums.LlmCacheBackend import LlmCacheBackend
+
+
+class LlmCacheFactory:
+    _cache: LlmCache | None = None
+    _initialized: bool = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_cache(cls) -> LlmCache | None:
+        with cls._lock:
+            if not cls._initialized:
+                cls._cache = cls._create_cache()
+                cls._initialized = True
+            return cls._cache
+
+    @classmethod
+    def get_cache_for_temperature(cls, temperature: float | None) -> LlmCache | None:
+        if temperature is None or temperature > 0:
+            return None
+
+        return cls.get_cache()
+
+    @staticmethod
+    def _create_cache() -> LlmCache | None:
+        backend = LlmCacheBackend.get_by_value(os.getenv('LLM_CACHE_BACKEND'))
+        max_entries = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 1000))
+        ttl = float(os.getenv('LLM_CACHE_TTL', 86400))
+
+        match backend:
+            case LlmCacheBackend.SQLITE:
+                return SqliteLlmCache(os.getenv('LLM_CACHE_PATH', './storage/llm_cache.sqlite'), max_entries, ttl)
+            case LlmCacheBackend.MEMORY:
+                return InMemoryLlmCache(max_entries, ttl)
+            case _:
+                return None
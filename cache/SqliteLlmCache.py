@@ -0,0 +1,79 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Tuple
+
+from langchain_core.caches import RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+from cache.LlmCache import LlmCache
+
+
+class SqliteLlmCache(LlmCache):
+    def __init__(self, database_path: str, max_entries: int, ttl: float) -> None:
+        super().__init__(max_entries, ttl)
+        directory = os.path.dirname(database_path)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at)')
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM llm_cache')
+
+    def _get(self, key: str) -> Tuple[RETURN_VAL_TYPE, float] | None:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT value, created_at FROM llm_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute('UPDATE llm_cache SET accessed_at = ? WHERE key = ?', (time.time(), key))
+
+        try:
+            return [loads(item) for item in json.loads(row[0])], row[1]
+        except (json.JSONDecodeError, TypeError, ValueError):
+            self._delete(key)
+            return None
+
+    def _set(self, key: str, value: RETURN_VAL_TYPE, created_at: float) -> None:
+        serialized = json.dumps([dumps(generation) for generation in value])
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, serialized, created_at, created_at)
+            )
+
+    def _delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM llm_cache WHERE key = ?', (key,))
+
+    def _evict(self) -> None:
+        with self._lock, self._connection:
+            if self.ttl > 0:
+                self._connection.execute('DELETE FROM llm_cache WHERE created_at < ?', (time.time() - self.ttl,))
+            self._connection.execute('''
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            ''', (self.max_entries,))
+
+    def _count(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM llm_cache').fetchone()[0]
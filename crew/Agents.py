@@ -4,31 +4,35 @@ from textwrap import dedent
 from typing import List
 
 from crewai import Agent
-from langchain_anthropic import ChatAnthropic
-from langchain_community.chat_models import ChatOllama
+from crewai.utilities import I18N
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
-from langchain_openai import ChatOpenAI
 
+from crew.CaseBriefFactory import CaseBriefFactory
+from crew.LlmClientPool import LlmClientPool
+from crew.MetricsCallbackHandler import MetricsCallbackHandler
+from crew.StreamingCallbackHandler import StreamingCallbackHandler
+from crew.Tools import ToolsFactory
 from enums.AgentPurpose import AgentPurpose
 from enums.AiModel import AiModel
-from state.AppState import AppState
+from simulation.Simulation import Simulation
+from state.HearingConfig import HearingConfig
+
+PROMPT_FILE = os.path.join(os.path.dirname(__file__), 'prompts.json')
 
 
 class BaseAgent(ABC):
     llm: BaseChatModel = NotImplemented
     tools: List[BaseTool] = NotImplemented
-    case_description: str = NotImplemented
 
     @abstractmethod
     def __init__(self,
                  llm: BaseChatModel,
-                 tools: List[BaseTool],
-                 case_description: str
+                 tools: List[BaseTool]
                  ) -> None:
         self.llm = llm
         self.tools = tools
-        self.case_description = case_description
 
     @abstractmethod
     def create(self) -> Agent:
@@ -38,128 +42,104 @@ class BaseAgent(ABC):
 class JudgeAgent(BaseAgent):
     def __init__(self,
                  llm: BaseChatModel,
-                 tools: List[BaseTool],
-                 case_description: str
+                 tools: List[BaseTool]
                  ) -> None:
         self.llm = llm
         self.tools = tools
-        self.case_description = case_description
 
     def create(self) -> Agent:
         return Agent(
             role='A Judge in the supreme court',
             goal='Conduct a court hearing and issue a final verdict based on the evidence presented by the prosecution and the defense.',
-            backstory=dedent(f'''
+            backstory=dedent('''
             As a top supreme court judge, you have honed your skills in law and have handled numerous court cases.
             Your extensive experience allows you to make fair and informed judgments based on the evidence and arguments presented.
-            
-            Case description:
-            {self.case_description}
             '''),
             tools=self.tools,
             llm=self.llm,
             max_iter=1,
-            max_rpm=20,
             verbose=True,
-            memory=True,
             allow_delegation=True,
-            cache=True
+            cache=True,
+            i18n=I18N(prompt_file=PROMPT_FILE)
         )
 
 
 class WitnessAgent(BaseAgent):
     def __init__(self,
                  llm: BaseChatModel,
-                 tools: List[BaseTool],
-                 case_description: str
+                 tools: List[BaseTool]
                  ) -> None:
         self.llm = llm
         self.tools = tools
-        self.case_description = case_description
 
     def create(self) -> Agent:
         return Agent(
             role='Witness at court hearing',
             goal='Provide truthful testimony based on personal knowledge and experience, answering questions posed by both the prosecution and the defense.',
-            backstory=dedent(f'''
+            backstory=dedent('''
             You were at the scene of the incident and have firsthand knowledge of what transpired.
             Your testimony is crucial in helping the court understand the facts of the case.
-            
-            Case description:
-            {self.case_description}
             '''),
             tools=self.tools,
             llm=self.llm,
             max_iter=5,
-            max_rpm=20,
             verbose=True,
-            memory=True,
             allow_delegation=True,
-            cache=True
+            cache=True,
+            i18n=I18N(prompt_file=PROMPT_FILE)
         )
 
 
 class ProsecutionAgent(BaseAgent):
     def __init__(self,
                  llm: BaseChatModel,
-                 tools: List[BaseTool],
-                 case_description: str
+                 tools: List[BaseTool]
                  ) -> None:
         self.llm = llm
         self.tools = tools
-        self.case_description = case_description
 
     def create(self) -> Agent:
         return Agent(
             role='Prosecutor at court hearing',
             goal='Present evidence and arguments that prove the guilt of the accused beyond a reasonable doubt.',
-            backstory=dedent(f'''
+            backstory=dedent('''
             As a seasoned prosecutor with a track record of high-profile cases, you are known for your meticulous preparation and compelling arguments.
             You believe in the justice system and your role in ensuring that criminals are held accountable for their actions.
-            
-            Case description:
-            {self.case_description}
             '''),
             tools=self.tools,
             llm=self.llm,
             max_iter=5,
-            max_rpm=20,
             verbose=True,
-            memory=True,
             allow_delegation=True,
-            cache=True
+            cache=True,
+            i18n=I18N(prompt_file=PROMPT_FILE)
         )
 
 
 class DefenseAgent(BaseAgent):
     def __init__(self,
                  llm: BaseChatModel,
-                 tools: List[BaseTool],
-                 case_description: str
+                 tools: List[BaseTool]
                  ) -> None:
         self.llm = llm
         self.tools = tools
-        self.case_description = case_description
 
     def create(self) -> Agent:
         return Agent(
             role='Defense attorney at court hearing',
             goal='Present evidence and arguments that create reasonable doubt about the guilt of the accused and ensure they receive a fair trial.',
-            backstory=dedent(f'''
+            backstory=dedent('''
             With years of experience defending clients in criminal cases, you are known for your tenacity and skill in the courtroom.
             You are committed to protecting the rights of the accused and ensuring that the burden of proof lies with the prosecution.
-            
-            Case description:
-            {self.case_description}
             '''),
             tools=self.tools,
             llm=self.llm,
             max_iter=5,
-            max_rpm=20,
             verbose=True,
-            memory=True,
             allow_delegation=True,
-            cache=True
+            cache=True,
+            i18n=I18N(prompt_file=PROMPT_FILE)
         )
 
 
@@ -167,41 +147,42 @@ class JuryAgent(BaseAgent):
     def __init__(self,
                  llm: BaseChatModel,
                  tools: List[BaseTool],
-                 case_description: str
+                 juror_number: int = 1
                  ) -> None:
         self.llm = llm
         self.tools = tools
-        self.case_description = case_description
+        self.juror_number = juror_number
 
     def create(self) -> Agent:
         return Agent(
-            role='Jury member at court hearing',
+            role=f'Jury member #{self.juror_number} at court hearing',
             goal='Listen to the evidence presented by both the prosecution and the defense, deliberate with fellow jurors, and deliver a fair and impartial verdict based on the evidence.',
-            backstory=dedent(f'''
+            backstory=dedent('''
             You are part of a diverse group of citizens selected to serve as a juror in this case.
             Your background and experiences bring a unique perspective to the jury deliberation process.
             You understand the gravity of your duty and are committed to delivering a just verdict based on the evidence presented.
-            
-            Case description:
-            {self.case_description}
             '''),
             tools=self.tools,
             llm=self.llm,
             max_iter=5,
-            max_rpm=20,
             verbose=True,
-            memory=True,
             allow_delegation=True,
-            cache=True
+            cache=True,
+            i18n=I18N(prompt_file=PROMPT_FILE)
         )
 
 
 class AgentsFactory:
+    def __init__(self, config: HearingConfig, simulation: Simulation | None = None) -> None:
+        self.config = config
+        self.simulation = simulation
+        self._case_brief: str | None = None
+        self._precedent_tools: List[BaseTool] | None = None
+
     def judge_agent(self) -> Agent:
         agent = JudgeAgent(
             self._get_llm_by_choose(AgentPurpose.JUDGE),
-            [],
-            AppState.get_value('case_description')
+            self.precedent_tools
         )
 
         return agent.create()
@@ -209,17 +190,25 @@ class AgentsFactory:
     def jury_agent(self) -> Agent:
         agent = JuryAgent(
             self._get_llm_by_choose(AgentPurpose.JURY),
-            [],
-            AppState.get_value('case_description')
+            self.precedent_tools
         )
 
         return agent.create()
 
+    def jury_agents(self, amount: int) -> List[Agent]:
+        return [
+            JuryAgent(
+                self._get_llm_by_choose(AgentPurpose.JURY, streaming=False),
+                self.precedent_tools,
+                juror_number
+            ).create()
+            for juror_number in range(1, amount + 1)
+        ]
+
     def witness_agent(self) -> Agent:
         agent = WitnessAgent(
             self._get_llm_by_choose(AgentPurpose.WITNESS),
-            [],
-            AppState.get_value('case_description')
+            []
         )
 
         return agent.create()
@@ -227,8 +216,7 @@ class AgentsFactory:
     def prosecution_agent(self) -> Agent:
         agent = ProsecutionAgent(
             self._get_llm_by_choose(AgentPurpose.PROSECUTOR),
-            [],
-            AppState.get_value('case_description')
+            []
         )
 
         return agent.create()
@@ -236,59 +224,75 @@ class AgentsFactory:
     def defense_agent(self) -> Agent:
         agent = DefenseAgent(
             self._get_llm_by_choose(AgentPurpose.DEFENSE),
-            [],
-            AppState.get_value('case_description')
+            []
         )
 
         return agent.create()
 
-    def _get_llm_by_choose(self, agent_name: AgentPurpose) -> BaseChatModel:
-        model = AppState.get_value(f'{agent_name.value.lower()}_model')
-        open_ai_api_key = AppState.get_value('openai_key')
-        anthropic_api_key = AppState.get_value('anthropic_key')
-        temperature = AppState.get_value(f'{agent_name.value.lower()}_temperature')
-
-        match model:
-            case AiModel.OPEN_AI_GPT_35_TURBO:
-                return ChatOpenAI(
-                    api_key=open_ai_api_key,
-                    model=AiModel.get_tech_name(AiModel.OPEN_AI_GPT_35_TURBO),
-                    temperature=temperature
-                )
-            case AiModel.OPEN_AI_GPT_4_TURBO:
-                return ChatOpenAI(
-                    api_key=open_ai_api_key,
-                    model=AiModel.get_tech_name(AiModel.OPEN_AI_GPT_4_TURBO),
-                    temperature=temperature
-                )
-            case AiModel.OPEN_AI_GPT_4_O:
-                return ChatOpenAI(
-                    api_key=open_ai_api_key,
-                    model=AiModel.get_tech_name(AiModel.OPEN_AI_GPT_4_O),
-                    temperature=temperature
-                )
-            case AiModel.ANTHROPIC_CLAUDE_HAIKU:
-                return ChatAnthropic(
-                    api_key=anthropic_api_key,
-                    model_name=AiModel.get_tech_name(AiModel.ANTHROPIC_CLAUDE_HAIKU),
-                    temperature=temperature
-                )
-            case AiModel.ANTHROPIC_CLAUDE_SONNET:
-                return ChatAnthropic(
-                    api_key=anthropic_api_key,
-                    model_name=AiModel.get_tech_name(AiModel.ANTHROPIC_CLAUDE_SONNET),
-                    temperature=temperature
-                )
-            case AiModel.ANTHROPIC_CLAUDE_OPUS:
-                return ChatAnthropic(
-                    api_key=anthropic_api_key,
-                    model_name=AiModel.get_tech_name(AiModel.ANTHROPIC_CLAUDE_OPUS),
-                    temperature=temperature
-                )
-            case AiModel.LLAMA_3_8B:
-                return ChatOllama(
-                    base_url=os.getenv('OLLAMA_URL'),
-                    model='llama3',
-                    temperature=temperature,
-                    stream=False
-                )
+    @property
+    def case_brief(self) -> str:
+        if self._case_brief is None:
+            model = self.config.supervisor.model
+            llm = LlmClientPool().get(
+                model,
+                self.config.get_api_key(AiModel.get_provider(model)),
+                0.0,
+                self._get_metrics_callbacks(AgentPurpose.CREW_SUPERVISOR, model)
+            )
+            self._case_brief = CaseBriefFactory().get_brief(self.config.case_description, model, llm)
+
+        return self._case_brief
+
+    @property
+    def precedent_tools(self) -> List[BaseTool]:
+        if self._precedent_tools is None:
+            tool = ToolsFactory.get_precedent_tool(self.config.case_description, self.config.openai_key)
+            self._precedent_tools = [tool] if tool is not None else []
+
+        return self._precedent_tools
+
+    def get_agent(self, agent_purpose: AgentPurpose) -> Agent:
+        match agent_purpose:
+            case AgentPurpose.JUDGE:
+                return self.judge_agent()
+            case AgentPurpose.WITNESS:
+                return self.witness_agent()
+            case AgentPurpose.PROSECUTOR:
+                return self.prosecution_agent()
+            case AgentPurpose.DEFENSE:
+                return self.defense_agent()
+            case AgentPurpose.JURY:
+                return self.jury_agent()
+            case _:
+                raise ValueError(f'Unsupported agent: {agent_purpose}')
+
+    def supervisor_llm(self) -> BaseChatModel:
+        return self._get_llm_by_choose(AgentPurpose.CREW_SUPERVISOR)
+
+    def _get_llm_by_choose(self, agent_name: AgentPurpose, streaming: bool = True) -> BaseChatModel:
+        agent_config = self.config.get_agent(agent_name)
+        api_key = self.config.get_api_key(AiModel.get_provider(agent_config.model))
+
+        return LlmClientPool().get(
+            agent_config.model,
+            api_key,
+            agent_config.temperature,
+            self._get_callbacks(agent_name, agent_config.model, streaming)
+        )
+
+    def _get_callbacks(self, agent_name: AgentPurpose, model: AiModel, streaming: bool = True) -> List[BaseCallbackHandler]:
+        if self.simulation is None:
+            return []
+        if not streaming:
+            return self._get_metrics_callbacks(agent_name, model)
+
+        return [
+            StreamingCallbackHandler(self.simulation, agent_name),
+            *self._get_metrics_callbacks(agent_name, model)
+        ]
+
+    def _get_metrics_callbacks(self, agent_name: AgentPurpose, model: AiModel) -> List[BaseCallbackHandler]:
+        if self.simulation is None:
+            return []
+
+        return [MetricsCallbackHandler(self.simulation.metrics, agent_name, model)]
@@ -0,0 +1,25 @@
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+from cache.EmbeddingCache import EmbeddingCache
+
+
+class CachedEmbeddings(Embeddings):
+    def __init__(self, embeddings: Embeddings, model: str, cache: EmbeddingCache) -> None:
+        self.embeddings = embeddings
+        self.model = model
+        self.cache = cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        cached = self.cache.get_many(self.model, texts)
+        missing = list(dict.fromkeys(text for text in texts if text not in cached))
+        if missing:
+            embedded = dict(zip(missing, self.embeddings.embed_documents(missing)))
+            self.cache.set_many(self.model, embedded)
+            cached.update(embedded)
+
+        return [cached[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
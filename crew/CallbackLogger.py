@@ -0,0 +1,119 @@
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Tuple, Union
+
+from langchain_core.agents import AgentFinish
+
+AgentOutput = Union[str, List[Tuple[Any, str]], AgentFinish]
+
+_STOP = object()
+
+
+class CallbackLogger:
+    def __init__(self, hearing_id: str, batch_size: int = 100, flush_interval: float = 1.0) -> None:
+        directory = os.getenv('CALLBACK_LOG_DIR', './logs/callbacks')
+        self.hearing_id = hearing_id
+        self.path = os.path.join(directory, f'{hearing_id}.jsonl')
+        self.max_bytes = int(os.getenv('CALLBACK_LOG_MAX_BYTES', 5 * 1024 * 1024))
+        self.backup_count = int(os.getenv('CALLBACK_LOG_BACKUP_COUNT', 3))
+        self.max_field_length = int(os.getenv('CALLBACK_LOG_MAX_FIELD_LENGTH', 4000))
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._sequence = itertools.count(1)
+        self._queue: queue.Queue = queue.Queue(maxsize=int(os.getenv('CALLBACK_LOG_MAX_QUEUE_SIZE', 10000)))
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._worker, name=f'callback-logger-{hearing_id}', daemon=True)
+        self._thread.start()
+
+    def log(self, agent_output: AgentOutput, agent_name: str = 'Generic call') -> None:
+        try:
+            self._queue.put_nowait((next(self._sequence), time.time(), agent_name, agent_output))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _worker(self) -> None:
+        stopped = False
+        while not stopped:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                while item is not _STOP:
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self._queue.get_nowait()
+                stopped = item is _STOP
+            except queue.Empty:
+                pass
+
+            if batch:
+                self._write([self._to_record(*item) for item in batch])
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        lines = ''.join(json.dumps(record, ensure_ascii=False, default=str) + '\n' for record in records)
+        if os.path.exists(self.path) and os.path.getsize(self.path) + len(lines) > self.max_bytes:
+            self._rotate()
+
+        with open(self.path, 'a', encoding='utf-8') as log_file:
+            log_file.write(lines)
+
+    def _rotate(self) -> None:
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f'{self.path}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.path}.{index + 1}')
+
+        if self.backup_count > 0:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+
+    def _to_record(self, sequence: int, timestamp: float, agent_name: str, agent_output: AgentOutput) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            'hearing_id': self.hearing_id,
+            'sequence': sequence,
+            'timestamp': timestamp,
+            'agent_name': agent_name
+        }
+
+        if isinstance(agent_output, str):
+            try:
+                agent_output = json.loads(agent_output)
+            except json.JSONDecodeError:
+                pass
+
+        if isinstance(agent_output, list) and all(isinstance(item, tuple) for item in agent_output):
+            record['type'] = 'actions'
+            record['actions'] = [
+                {
+                    'tool': self._truncate(getattr(action, 'tool', 'Unknown')),
+                    'tool_input': self._truncate(getattr(action, 'tool_input', 'Unknown')),
+                    'log': self._truncate(getattr(action, 'log', 'Unknown')),
+                    'description': self._truncate(description)
+                }
+                for action, description in agent_output
+            ]
+        elif isinstance(agent_output, AgentFinish):
+            record['type'] = 'finish'
+            record['output'] = self._truncate(agent_output.return_values.get('output'))
+        else:
+            record['type'] = 'unknown'
+            record['output_type'] = type(agent_output).__name__
+            record['output'] = self._truncate(agent_output)
+
+        return record
+
+    def _truncate(self, value: Any) -> str:
+        text = value if isinstance(value, str) else str(value)
+        if len(text) > self.max_field_length:
+            return f'{text[:self.max_field_length]}... [truncated {len(text) - self.max_field_length} chars]'
+        return text
@@ -0,0 +1,53 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from textwrap import dedent
+
+from langchain_core.language_models import BaseChatModel
+
+from crew.Tasks import add_prompt_contraints
+from enums.AiModel import AiModel
+from state.SingletonMeta import SingletonMeta
+
+
+class CaseBriefFactory(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        self.min_length = int(os.getenv('CASE_BRIEF_MIN_LENGTH', 1200))
+        self.max_entries = int(os.getenv('CASE_BRIEF_MAX_ENTRIES', 256))
+        self._briefs: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_brief(self, case_description: str, model: AiModel, llm: BaseChatModel) -> str:
+        if self.min_length <= 0 or len(case_description) <= self.min_length:
+            return case_description
+
+        key = hashlib.sha256(f'{AiModel(model).value}:{case_description}'.encode('utf-8')).hexdigest()
+        with self._lock:
+            brief = self._briefs.get(key)
+            if brief is not None:
+                self._briefs.move_to_end(key)
+                return brief
+
+        brief = str(llm.invoke(self._get_prompt(case_description)).content).strip()
+        if not brief or len(brief) >= len(case_description):
+            brief = case_description
+
+        with self._lock:
+            self._briefs[key] = brief
+            while len(self._briefs) > self.max_entries:
+                self._briefs.popitem(last=False)
+
+        return brief
+
+    @staticmethod
+    def _get_prompt(case_description: str) -> str:
+        return dedent(f'''
+        Summarize the court case below into a brief for the judge, witness, prosecutor, defense and jury.
+        Keep every party, date, place, amount, piece of evidence and claim. Drop repetitions and filler.
+
+        Output constraints:
+        {add_prompt_contraints(sentences=8)}
+
+        Case description:
+        ''') + case_description
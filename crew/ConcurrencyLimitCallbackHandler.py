@@ -0,0 +1,38 @@
+import threading
+from typing import Any, Dict, List, Set
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+
+class ConcurrencyLimitCallbackHandler(BaseCallbackHandler):
+    def __init__(self, semaphore: Any) -> None:
+        self.semaphore = semaphore
+        self._runs: Set[UUID] = set()
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self,
+                            serialized: Dict[str, Any],
+                            messages: List[List[BaseMessage]],
+                            *,
+                            run_id: UUID,
+                            **kwargs: Any
+                            ) -> None:
+        self.semaphore.acquire()
+        with self._lock:
+            self._runs.add(run_id)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        self._release(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._release(run_id)
+
+    def _release(self, run_id: UUID) -> None:
+        with self._lock:
+            if run_id not in self._runs:
+                return
+            self._runs.remove(run_id)
+        self.semaphore.release()
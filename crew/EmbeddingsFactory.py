@@ -0,0 +1,63 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Tuple
+
+from langchain_community.embeddings import OllamaEmbeddings
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+from cache.EmbeddingCache import EmbeddingCache
+from crew.CachedEmbeddings import CachedEmbeddings
+from crew.OnnxEmbeddings import OnnxEmbeddings
+from enums.EmbeddingProvider import EmbeddingProvider
+
+
+class EmbeddingsFactory:
+    _embeddings: Dict[Tuple[EmbeddingProvider, str], CachedEmbeddings] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_provider(cls) -> EmbeddingProvider:
+        return EmbeddingProvider.get_by_value(os.getenv('MEMORY_EMBEDDINGS'))
+
+    @classmethod
+    def get_embeddings(cls, openai_key: str | None = None) -> CachedEmbeddings | None:
+        provider = cls.get_provider()
+        if provider == EmbeddingProvider.NONE:
+            return None
+
+        key = (provider, hashlib.sha256((openai_key or '').encode('utf-8')).hexdigest())
+        with cls._lock:
+            if key not in cls._embeddings:
+                model = cls._get_model(provider)
+                cls._embeddings[key] = CachedEmbeddings(
+                    cls._create(provider, model, openai_key),
+                    f'{provider.value}:{model}',
+                    EmbeddingCache()
+                )
+            return cls._embeddings[key]
+
+    @staticmethod
+    def _get_model(provider: EmbeddingProvider) -> str:
+        match provider:
+            case EmbeddingProvider.OPEN_AI:
+                return os.getenv('MEMORY_EMBEDDINGS_MODEL') or 'text-embedding-3-small'
+            case EmbeddingProvider.OLLAMA:
+                return os.getenv('MEMORY_EMBEDDINGS_MODEL') or 'nomic-embed-text'
+            case EmbeddingProvider.LOCAL:
+                return OnnxEmbeddings.MODEL_NAME
+            case _:
+                return 'fake'
+
+    @staticmethod
+    def _create(provider: EmbeddingProvider, model: str, openai_key: str | None) -> Embeddings:
+        match provider:
+            case EmbeddingProvider.OPEN_AI:
+                return OpenAIEmbeddings(api_key=openai_key, model=model, max_retries=2)
+            case EmbeddingProvider.OLLAMA:
+                return OllamaEmbeddings(base_url=os.getenv('OLLAMA_URL', 'http://localhost:11434'), model=model)
+            case EmbeddingProvider.LOCAL:
+                return OnnxEmbeddings()
+            case _:
+                return DeterministicFakeEmbedding(size=384)
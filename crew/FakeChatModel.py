@@ -0,0 +1,108 @@
+import json
+import random
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import generate_from_stream
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+_SUBJECTS = ['The defendant', 'The witness', 'The prosecution', 'The defense', 'The court', 'The evidence']
+_VERBS = ['has shown', 'clearly indicates', 'does not establish', 'strongly suggests', 'fails to prove', 'confirms']
+_OBJECTS = ['the timeline of events', 'the motive behind the act', 'a reasonable doubt', 'the reliability of the testimony',
+            'the facts presented in this case', 'the credibility of the statement']
+
+
+class FakeChatModel(BaseChatModel):
+    model: str = 'fake-court'
+    seed: int = 0
+    responses: List[str] = []
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    tokens_per_second: float = 0.0
+    tool_call_rate: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return 'fake-court'
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {
+            'model': self.model,
+            'seed': self.seed,
+            'responses': self.responses,
+            'tool_call_rate': self.tool_call_rate
+        }
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any
+                  ) -> ChatResult:
+        return generate_from_stream(self._stream(messages, stop, run_manager, **kwargs))
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any
+                ) -> Iterator[ChatGenerationChunk]:
+        prompt = '\n'.join(str(message.content) for message in messages)
+        rng = random.Random(f'{self.seed}:{prompt}')
+
+        time.sleep(max(0.0, rng.gauss(self.latency, self.latency_jitter)))
+
+        for token in re.findall(r'\s*\S+', self._respond(prompt, rng)):
+            if self.tokens_per_second > 0:
+                time.sleep(rng.expovariate(self.tokens_per_second))
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager is not None:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    def _respond(self, prompt: str, rng: random.Random) -> str:
+        if self.responses:
+            return rng.choice(self.responses)
+
+        if 'Current Task:' not in prompt:
+            return self._answer(prompt, rng)
+
+        tool_names = re.search(r'only one name of \[(.*?)\], just the name', prompt)
+        scratchpad = prompt.rsplit('Current Task:', 1)[-1]
+        if tool_names and 'Observation:' not in scratchpad and rng.random() < self.tool_call_rate:
+            return self._tool_call(prompt, tool_names.group(1).split(', '), rng)
+
+        return f'Thought: I now can give a great answer\nFinal Answer: {self._answer(prompt, rng)}'
+
+    def _tool_call(self, prompt: str, tool_names: List[str], rng: random.Random) -> str:
+        tool_name = rng.choice(tool_names)
+        signature = re.search(rf'{re.escape(tool_name)}\((.*?)\)', prompt)
+        arguments = re.findall(r'(\w+):', signature.group(1)) if signature else ['input']
+        coworkers = re.search(r'co-workers: \[(.*?)\]', prompt)
+
+        tool_input = {}
+        for argument in arguments:
+            if argument == 'coworker' and coworkers:
+                tool_input[argument] = rng.choice(coworkers.group(1).split(', '))
+            else:
+                tool_input[argument] = self._sentence(rng)
+
+        return f'Thought: I should use a tool\nAction: {tool_name}\nAction Input: {json.dumps(tool_input)}'
+
+    def _answer(self, prompt: str, rng: random.Random) -> str:
+        sentences = [self._sentence(rng) for _ in range(rng.randint(1, 3))]
+        task = prompt.rsplit('Current Task:', 1)[-1]
+        if 'VOTE:' in task:
+            return f'{" ".join(sentences)}\nVOTE: {rng.choice(["GUILTY", "NOT_GUILTY"])}'
+        if 'verdict' in task.lower():
+            sentences.append(f'The defendant is found {rng.choice(["guilty", "not guilty"])}.')
+
+        return ' '.join(sentences)
+
+    def _sentence(self, rng: random.Random) -> str:
+        return f'{rng.choice(_SUBJECTS)} {rng.choice(_VERBS)} {rng.choice(_OBJECTS)}.'
@@ -0,0 +1,225 @@
+import logging
+import os
+from typing import List, Optional
+
+from crewai import Crew, Task
+from crewai.tasks.task_output import TaskOutput
+
+from crew.Agents import AgentsFactory
+from crew.Crew import CourtCrew
+from crew.EmbeddingsFactory import EmbeddingsFactory
+from crew.HearingPlan import HearingPlan
+from crew.HearingScript import CompiledHearingScript, HearingScriptRegistry
+from crew.JuryPanel import JuryPanel
+from crew.Tasks import agent_callback
+from crew.Tools import ToolsFactory
+from crew.models import JuryVerdict, Precedent
+from enums.AgentPurpose import AgentPurpose
+from enums.HearingScheduler import HearingScheduler
+from enums.SimulationStatus import SimulationStatus
+from exceptions.SimulationCancelledException import SimulationCancelledException
+from simulation.CheckpointStore import CheckpointStore
+from simulation.HearingCheckpoint import HearingCheckpoint
+from simulation.HearingMemory import HearingMemory
+from simulation.MemoryStore import MemoryStore
+from simulation.PrecedentStore import PrecedentStore
+from simulation.Simulation import Simulation
+from state.HearingConfig import HearingConfig
+
+logger = logging.getLogger(__name__)
+
+
+def simulation_callback(simulation: Simulation, agent_purpose: AgentPurpose) -> agent_callback:
+    def callback(agent_output: TaskOutput) -> None:
+        simulation.add_message(agent_purpose, agent_output.result())
+        simulation.raise_if_cancelled()
+
+    return callback
+
+
+def timed_callback(simulation: Simulation, agent_role: str, callback: agent_callback) -> agent_callback:
+    def timed(agent_output: TaskOutput) -> None:
+        simulation.metrics.record_sequential_task(agent_role, agent_output.description)
+        callback(agent_output)
+
+    return timed
+
+
+def checkpointed_callback(checkpoint: HearingCheckpoint, step: str, callback: agent_callback) -> agent_callback:
+    def checkpointed(agent_output: TaskOutput) -> None:
+        checkpoint.save(step, agent_output)
+        callback(agent_output)
+
+    return checkpointed
+
+
+class Hearing:
+    def __init__(self,
+                 crew: Crew | HearingPlan,
+                 jury_panel: Optional[JuryPanel] = None,
+                 checkpoint: Optional[HearingCheckpoint] = None,
+                 ruling: Optional[Task] = None
+                 ) -> None:
+        self.crew = crew
+        self.jury_panel = jury_panel
+        self.checkpoint = checkpoint
+        self.ruling = ruling
+        self.jury_verdict: Optional[JuryVerdict] = None
+
+    def run(self) -> str:
+        tasks = list(self.crew.tasks)
+        if isinstance(self.crew, Crew) and self.checkpoint is not None:
+            self.crew.tasks = self._restore_crew_tasks(tasks)
+
+        try:
+            result = self.crew.kickoff() if self.crew.tasks else tasks[-1].output.raw_output
+
+            if isinstance(self.crew, HearingPlan):
+                self.jury_verdict = self.crew.jury_verdict
+            elif self.jury_panel is not None and self.ruling is not None:
+                hearing_record = '\n'.join(task.output.raw_output for task in tasks if task.output)
+                self.jury_verdict = self.jury_panel.deliberate(hearing_record)
+                result = self.ruling.execute(
+                    agent=self.ruling.agent,
+                    context=f'{hearing_record}\n\n{self.jury_verdict.describe()}'
+                )
+        except SimulationCancelledException:
+            if self.checkpoint is not None:
+                self.checkpoint.clear()
+            raise
+
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+
+        return result
+
+    def _restore_crew_tasks(self, tasks: List[Task]) -> List[Task]:
+        restored = 0
+        for index, task in enumerate(tasks):
+            if not self.checkpoint.restore(f'task-{index}', task):
+                break
+            task.callback(task.output)
+            restored += 1
+
+        for index, task in enumerate(tasks[restored:], start=restored):
+            task.callback = checkpointed_callback(self.checkpoint, f'task-{index}', task.callback)
+
+        return tasks[restored:]
+
+
+class HearingFactory:
+    def get_hearing(self,
+                    config: HearingConfig,
+                    simulation: Simulation,
+                    hearing_id: Optional[str] = None,
+                    resume: bool = False
+                    ) -> Hearing:
+        agents_factory = AgentsFactory(config, simulation)
+        script = self._get_script(config)
+        case_brief = agents_factory.case_brief
+
+        agents = {agent_purpose: agents_factory.get_agent(agent_purpose) for agent_purpose in script.roles}
+        tasks = script.create_tasks(
+            agents,
+            {agent_purpose: simulation_callback(simulation, agent_purpose) for agent_purpose in agents}
+        )
+
+        jury_panel = None
+        if script.jury:
+            jury_panel = JuryPanel(
+                agents_factory.jury_agents(config.juries_amount),
+                simulation,
+                script.jury_template,
+                case_brief
+            )
+
+        scheduler = HearingScheduler.get_by_value(os.getenv('HEARING_SCHEDULER'))
+        checkpoint = None
+        if hearing_id is not None and os.getenv('CHECKPOINTS_ENABLED', 'true').lower() == 'true':
+            checkpoint = HearingCheckpoint(CheckpointStore(), hearing_id, resume)
+
+        if scheduler == HearingScheduler.HIERARCHICAL:
+            ordered_tasks = script.get_ordered_tasks(tasks)
+            ruling = tasks[script.jury_before] if jury_panel is not None else None
+            for task in ordered_tasks:
+                task.description = f'{task.description}\n\n{task.agent.i18n.slice("case").format(case=case_brief)}'
+                task.callback = timed_callback(simulation, task.agent.role, task.callback)
+
+            crew = CourtCrew().get_crew(
+                agents=list(agents.values()),
+                tasks=[task for task in ordered_tasks if task is not ruling],
+                manager_llm=agents_factory.supervisor_llm(),
+                simulation=simulation
+            )
+            self._record_precedent(config, simulation)
+
+            return Hearing(crew, jury_panel, checkpoint, ruling)
+
+        court_crew = CourtCrew()
+        callback_logger = court_crew.get_callback_logger(simulation)
+        for agent in agents.values():
+            agent.step_callback = court_crew.get_step_callback(simulation, callback_logger, agent.role)
+
+        plan = script.get_plan(
+            tasks,
+            simulation.metrics,
+            checkpoint,
+            self._get_memory(config, simulation),
+            case_brief,
+            jury_panel
+        )
+        self._record_precedent(config, simulation)
+
+        return Hearing(plan, checkpoint=checkpoint)
+
+    @staticmethod
+    def _get_memory(config: HearingConfig, simulation: Simulation) -> Optional[HearingMemory]:
+        embeddings = EmbeddingsFactory.get_embeddings(config.openai_key)
+        if embeddings is None:
+            return None
+
+        memory = HearingMemory(MemoryStore(), embeddings, simulation.id, config.case_description)
+        simulation.add_finish_callback(lambda _: memory.clear())
+
+        return memory
+
+    @staticmethod
+    def _record_precedent(config: HearingConfig, simulation: Simulation) -> None:
+        embeddings = EmbeddingsFactory.get_embeddings(config.openai_key)
+        if embeddings is None or not ToolsFactory.precedents_enabled():
+            return
+
+        def record(finished_simulation: Simulation) -> None:
+            verdicts = finished_simulation.get_messages(AgentPurpose.JUDGE)
+            if finished_simulation.status != SimulationStatus.FINISHED or not verdicts:
+                return
+
+            jury_verdicts = finished_simulation.get_messages(AgentPurpose.JURY)
+            precedent = Precedent(
+                case_description=config.case_description,
+                court_type=config.court_type.value,
+                arguments='\n'.join(
+                    finished_simulation.get_messages(AgentPurpose.PROSECUTOR)
+                    + finished_simulation.get_messages(AgentPurpose.DEFENSE)
+                ),
+                verdict=verdicts[-1],
+                jury_verdict=jury_verdicts[-1] if jury_verdicts else None
+            )
+            try:
+                PrecedentStore().add(
+                    embeddings.model,
+                    finished_simulation.id,
+                    precedent,
+                    embeddings.embed_query(config.case_description)
+                )
+            except Exception:
+                logger.exception('Recording precedent of simulation %s failed', finished_simulation.id)
+
+        simulation.add_finish_callback(record)
+
+    @staticmethod
+    def _get_script(config: HearingConfig) -> CompiledHearingScript:
+        if config.hearing_script is not None:
+            return HearingScriptRegistry().get(config.hearing_script)
+
+        return HearingScriptRegistry().get_for_court_type(config.court_type)
@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
+
+from crewai import Task
+
+from crew.JuryPanel import JuryPanel
+from crew.Tasks import agent_callback
+from crew.models import JuryVerdict
+from exceptions.InvalidHearingPlanException import InvalidHearingPlanException
+from simulation.HearingCheckpoint import HearingCheckpoint
+from simulation.HearingMemory import HearingMemory
+from simulation.HearingMetrics import HearingMetrics
+
+
+class HearingStep:
+    def __init__(self, name: str, task: Task, depends_on: Optional[List[str]] = None) -> None:
+        self.name = name
+        self.task = task
+        self.depends_on = depends_on or []
+        self.callback: Optional[agent_callback] = task.callback
+        task.callback = None
+
+
+class HearingPlan:
+    def __init__(self,
+                 steps: List[HearingStep],
+                 metrics: Optional[HearingMetrics] = None,
+                 checkpoint: Optional[HearingCheckpoint] = None,
+                 memory: Optional[HearingMemory] = None,
+                 case_description: Optional[str] = None,
+                 jury_panel: Optional[JuryPanel] = None,
+                 jury_step: Optional[str] = None
+                 ) -> None:
+        self.steps = steps
+        self.metrics = metrics
+        self.checkpoint = checkpoint
+        self.memory = memory
+        self.case_description = case_description
+        self.jury_panel = jury_panel
+        self.jury_step = jury_step
+        self.jury_verdict: Optional[JuryVerdict] = None
+        self._steps_by_name = {step.name: step for step in steps}
+        self._validate()
+
+    @property
+    def tasks(self) -> List[Task]:
+        return [step.task for step in self.steps]
+
+    def kickoff(self) -> str:
+        finished: Set[str] = {
+            step.name for step in self.steps
+            if self.checkpoint is not None and self.checkpoint.restore(step.name, step.task)
+        }
+        pending: Dict[str, Set[str]] = {
+            step.name: set(step.depends_on) for step in self.steps if step.name not in finished
+        }
+        running: Dict[Future, str] = {}
+        emitted = self._emit(finished, 0)
+        agent_locks: Dict[int, threading.Lock] = defaultdict(threading.Lock)
+        if self.memory is not None:
+            self.memory.remember_case()
+            for step in self.steps:
+                if step.name in finished:
+                    self.memory.remember(step.task.agent.role, step.name, step.task.output.raw_output)
+
+        with ThreadPoolExecutor(max_workers=int(os.getenv('HEARING_MAX_CONCURRENCY', 4)),
+                                thread_name_prefix='hearing-step') as executor:
+            while pending or running:
+                for name in [name for name, depends_on in pending.items() if depends_on <= finished]:
+                    step = self._steps_by_name[name]
+                    del pending[name]
+                    running[executor.submit(self._execute, step, agent_locks[id(step.task.agent)])] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                    finished.add(running.pop(future))
+
+                emitted = self._emit(finished, emitted)
+
+        return self.steps[-1].task.output.raw_output
+
+    def _execute(self, step: HearingStep, agent_lock: threading.Lock) -> str:
+        if self.jury_panel is not None and step.name == self.jury_step:
+            self.jury_verdict = self.jury_panel.deliberate('\n'.join(
+                other.task.output.raw_output for other in self.steps if other is not step and other.task.output
+            ))
+
+        with agent_lock:
+            started_at = time.time()
+            result = step.task.execute(agent=step.task.agent, context=self._get_context(step))
+
+        if self.metrics is not None:
+            self.metrics.record_task(step.task.agent.role, step.task.description, time.time() - started_at)
+        if self.checkpoint is not None:
+            self.checkpoint.save(step.name, step.task.output)
+        if self.memory is not None:
+            self.memory.remember(step.task.agent.role, step.name, step.task.output.raw_output)
+
+        return result
+
+    def _get_context(self, step: HearingStep) -> Optional[str]:
+        outputs = [self._steps_by_name[name].task.output.raw_output for name in step.depends_on]
+        context = '\n'.join(outputs)
+        if self.memory is not None:
+            memories = self.memory.recall(f'{step.task.description} {context}'.strip(), set(outputs))
+            if memories:
+                context += step.task.agent.i18n.slice('memory').format(
+                    memory='\n'.join(f'- {memory}' for memory in memories)
+                )
+        if self.jury_verdict is not None and step.name == self.jury_step:
+            context = f'{context}\n\n{self.jury_verdict.describe()}'.strip()
+        if self.case_description is not None:
+            case = step.task.agent.i18n.slice('case').format(case=self.case_description)
+            context = f'{case}\n\n{context}'.strip()
+
+        return context or None
+
+    def _emit(self, finished: Set[str], emitted: int) -> int:
+        while emitted < len(self.steps) and self.steps[emitted].name in finished:
+            step = self.steps[emitted]
+            if step.callback is not None:
+                step.callback(step.task.output)
+            emitted += 1
+
+        return emitted
+
+    def _validate(self) -> None:
+        if len(self._steps_by_name) != len(self.steps):
+            raise InvalidHearingPlanException('step names must be unique')
+
+        for step in self.steps:
+            unknown = [name for name in step.depends_on if name not in self._steps_by_name]
+            if unknown:
+                raise InvalidHearingPlanException(f'step "{step.name}" depends on unknown steps {unknown}')
+        if self.jury_step is not None and self.jury_step not in self._steps_by_name:
+            raise InvalidHearingPlanException(f'jury deliberates before unknown step "{self.jury_step}"')
+
+        resolved: Set[str] = set()
+        remaining = list(self.steps)
+        while remaining:
+            ready = [step for step in remaining if set(step.depends_on) <= resolved]
+            if not ready:
+                raise InvalidHearingPlanException(
+                    f'dependency cycle between steps {[step.name for step in remaining]}'
+                )
+            resolved.update(step.name for step in ready)
+            remaining = [step for step in remaining if step.name not in resolved]
@@ -0,0 +1,206 @@
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+import yaml
+from crewai import Agent, Task
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from crew.HearingPlan import HearingPlan, HearingStep
+from crew.JuryPanel import JuryPanel
+from crew.Tasks import CompiledTaskTemplate, TaskTemplateRegistry, agent_callback
+from enums.AgentPurpose import AgentPurpose
+from enums.CourtCaseType import CourtCaseType
+from exceptions.InvalidHearingPlanException import InvalidHearingPlanException
+from simulation.HearingCheckpoint import HearingCheckpoint
+from simulation.HearingMemory import HearingMemory
+from simulation.HearingMetrics import HearingMetrics
+from state.SingletonMeta import SingletonMeta
+
+HEARING_SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), 'templates', 'hearings')
+
+
+class HearingScriptStep(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    template: Optional[str] = None
+    depends_on: List[str] = []
+    sentences: Optional[int] = None
+    text_type: Optional[str] = None
+
+
+class HearingScript(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    court_types: List[CourtCaseType] = []
+    jury: bool = False
+    jury_template: str = 'jury_deliberation'
+    jury_before: str = 'verdict'
+    steps: List[HearingScriptStep] = Field(min_length=1)
+
+    def compile(self, task_templates: TaskTemplateRegistry) -> 'CompiledHearingScript':
+        templates = {}
+        for step in self.steps:
+            template = task_templates.get(step.template or step.name)
+            if step.sentences is not None or step.text_type is not None:
+                template = template.template.model_copy(update={
+                    key: value for key, value in (('sentences', step.sentences), ('text_type', step.text_type))
+                    if value is not None
+                }).compile()
+            templates[step.name] = template
+
+        levels = self._get_levels()
+        jury_template = None
+        if self.jury:
+            if levels[-1] != [self.jury_before] or any(self.jury_before in step.depends_on for step in self.steps):
+                raise InvalidHearingPlanException(
+                    f'jury of script "{self.name}" must deliberate before its last step, not "{self.jury_before}"'
+                )
+            jury_template = task_templates.get(self.jury_template)
+            if jury_template.template.agent != AgentPurpose.JURY:
+                raise InvalidHearingPlanException(
+                    f'jury template "{self.jury_template}" of script "{self.name}" is not a Jury task'
+                )
+
+        return CompiledHearingScript(self, templates, levels, jury_template)
+
+    def _get_levels(self) -> List[List[str]]:
+        names = [step.name for step in self.steps]
+        if len(set(names)) != len(names):
+            raise InvalidHearingPlanException(f'step names in script "{self.name}" must be unique')
+
+        for step in self.steps:
+            unknown = [name for name in step.depends_on if name not in names]
+            if unknown:
+                raise InvalidHearingPlanException(f'step "{step.name}" depends on unknown steps {unknown}')
+
+        levels = []
+        resolved: Set[str] = set()
+        remaining = list(self.steps)
+        while remaining:
+            ready = [step.name for step in remaining if set(step.depends_on) <= resolved]
+            if not ready:
+                raise InvalidHearingPlanException(
+                    f'dependency cycle between steps {[step.name for step in remaining]}'
+                )
+            levels.append(ready)
+            resolved.update(ready)
+            remaining = [step for step in remaining if step.name not in resolved]
+
+        return levels
+
+
+class CompiledHearingScript:
+    def __init__(self,
+                 script: HearingScript,
+                 templates: Dict[str, CompiledTaskTemplate],
+                 levels: List[List[str]],
+                 jury_template: Optional[CompiledTaskTemplate] = None
+                 ) -> None:
+        self.script = script
+        self.templates = templates
+        self.levels = levels
+        self.jury_template = jury_template
+        self.roles: List[AgentPurpose] = list(dict.fromkeys(template.template.agent for template in templates.values()))
+        self.parameters: List[str] = sorted({
+            parameter for template in templates.values() for parameter in template.parameters
+        })
+
+    @property
+    def name(self) -> str:
+        return self.script.name
+
+    @property
+    def jury(self) -> bool:
+        return self.script.jury
+
+    @property
+    def jury_before(self) -> str:
+        return self.script.jury_before
+
+    def create_tasks(self,
+                     agents: Dict[AgentPurpose, Agent],
+                     callbacks: Dict[AgentPurpose, agent_callback],
+                     **values: Any
+                     ) -> Dict[str, Task]:
+        return {
+            step.name: self.templates[step.name].create(
+                agents[self.templates[step.name].template.agent],
+                callbacks.get(self.templates[step.name].template.agent),
+                **values
+            )
+            for step in self.script.steps
+        }
+
+    def get_ordered_tasks(self, tasks: Dict[str, Task]) -> List[Task]:
+        return [tasks[name] for level in self.levels for name in level]
+
+    def get_plan(self,
+                 tasks: Dict[str, Task],
+                 metrics: Optional[HearingMetrics] = None,
+                 checkpoint: Optional[HearingCheckpoint] = None,
+                 memory: Optional[HearingMemory] = None,
+                 case_description: Optional[str] = None,
+                 jury_panel: Optional[JuryPanel] = None
+                 ) -> HearingPlan:
+        return HearingPlan(
+            [HearingStep(step.name, tasks[step.name], step.depends_on) for step in self.script.steps],
+            metrics,
+            checkpoint,
+            memory,
+            case_description,
+            jury_panel,
+            self.script.jury_before if jury_panel is not None else None
+        )
+
+
+class HearingScriptRegistry(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        self._scripts: Dict[str, CompiledHearingScript] = {}
+        self._lock = threading.Lock()
+        self.load(HEARING_SCRIPTS_DIR)
+        for path in filter(None, os.getenv('HEARING_SCRIPTS_PATH', '').split(os.pathsep)):
+            self.load(path)
+
+    def load(self, path: str) -> None:
+        paths = [path]
+        if os.path.isdir(path):
+            paths = [
+                os.path.join(path, file_name) for file_name in sorted(os.listdir(path))
+                if file_name.endswith(('.yaml', '.yml', '.json'))
+            ]
+
+        scripts = {}
+        for script_path in paths:
+            with open(script_path, encoding='utf-8') as file:
+                definition = yaml.safe_load(file) or {}
+            try:
+                script = HearingScript(**definition)
+            except (TypeError, ValidationError) as e:
+                raise InvalidHearingPlanException(f'{script_path}: {e}') from e
+            scripts[script.name] = script.compile(TaskTemplateRegistry())
+
+        with self._lock:
+            self._scripts.update(scripts)
+
+    def get(self, name: str) -> CompiledHearingScript:
+        with self._lock:
+            script = self._scripts.get(name)
+        if script is None:
+            raise InvalidHearingPlanException(f'hearing script "{name}" is not registered')
+
+        return script
+
+    def get_for_court_type(self, court_type: CourtCaseType) -> CompiledHearingScript:
+        with self._lock:
+            scripts = [script for script in self._scripts.values() if court_type in script.script.court_types]
+        if not scripts:
+            raise InvalidHearingPlanException(f'no hearing script for {court_type.value} cases')
+
+        return scripts[-1]
+
+    def get_names(self) -> List[str]:
+        with self._lock:
+            return list(self._scripts)
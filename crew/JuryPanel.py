@@ -0,0 +1,55 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from crewai import Agent
+from crewai.tasks.task_output import TaskOutput
+
+from crew.Tasks import CompiledTaskTemplate
+from crew.models import JuryVerdict, JuryVote
+from enums.AgentPurpose import AgentPurpose
+from enums.Verdict import Verdict
+from simulation.Simulation import Simulation
+
+
+class JuryPanel:
+    def __init__(self,
+                 jurors: List[Agent],
+                 simulation: Simulation,
+                 template: CompiledTaskTemplate,
+                 case_description: str
+                 ) -> None:
+        self.jurors = jurors
+        self.simulation = simulation
+        self.template = template
+        self.case_description = case_description
+
+    def deliberate(self, hearing_record: str) -> JuryVerdict:
+        max_workers = min(len(self.jurors), int(os.getenv('JURY_MAX_CONCURRENCY', 5)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='juror') as executor:
+            votes = list(executor.map(
+                lambda juror: self._deliberate_juror(juror[0], juror[1], hearing_record),
+                enumerate(self.jurors, start=1)
+            ))
+
+        jury_verdict = JuryVerdict.from_votes(votes)
+        self.simulation.add_message(AgentPurpose.JURY, jury_verdict.describe())
+
+        return jury_verdict
+
+    def _deliberate_juror(self, juror_number: int, juror: Agent, hearing_record: str) -> JuryVote:
+        self.simulation.raise_if_cancelled()
+        juror.step_callback = lambda _: self.simulation.raise_if_cancelled()
+
+        def callback(agent_output: TaskOutput) -> None:
+            self.simulation.add_message(AgentPurpose.JURY, f'Juror #{juror_number}: {agent_output.raw_output}')
+            self.simulation.raise_if_cancelled()
+
+        task = self.template.create(juror, callback)
+        started_at = time.time()
+        case = juror.i18n.slice('case').format(case=self.case_description)
+        statement = task.execute(agent=juror, context=f'{case}\n\n{hearing_record}')
+        self.simulation.metrics.record_task(juror.role, task.description, time.time() - started_at)
+
+        return JuryVote(juror=juror_number, verdict=Verdict.from_vote(statement), statement=statement)
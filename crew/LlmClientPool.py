@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Tuple
+
+import anthropic
+import httpx
+import openai
+from langchain_community.chat_models import ChatOllama
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.pydantic_v1 import BaseModel
+
+from cache.LlmCacheFactory import LlmCacheFactory
+from crew.ConcurrencyLimitCallbackHandler import ConcurrencyLimitCallbackHandler
+from crew.FakeChatModel import FakeChatModel
+from crew.PromptCachingChatAnthropic import PromptCachingChatAnthropic
+from crew.PromptCachingChatOpenAI import PromptCachingChatOpenAI
+from crew.RateLimitCallbackHandler import RateLimitCallbackHandler
+from crew.RateLimiter import RateLimiter
+from crew.ResilientChatModel import ResilientChatModel
+from enums.AiModel import AiModel
+from enums.AiProvider import AiProvider
+from state.SingletonMeta import SingletonMeta
+
+ModelKey = Tuple[AiModel, str, float | None]
+
+
+class LlmClientPool(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        self._models: Dict[ModelKey, BaseChatModel] = {}
+        self._http_clients: Dict[AiProvider, httpx.Client] = {}
+        self._openai_clients: Dict[str, openai.OpenAI] = {}
+        self._anthropic_clients: Dict[str, anthropic.Anthropic] = {}
+        self._concurrency_limits: Dict[AiProvider, Any] = {}
+        self._rate_limiters: Dict[Tuple[AiModel, str], RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def set_concurrency_limit(self, provider: AiProvider, semaphore: Any) -> None:
+        with self._lock:
+            self._concurrency_limits[provider] = semaphore
+
+    def get(self,
+            model: AiModel,
+            api_key: str | None,
+            temperature: float | None,
+            callbacks: List[BaseCallbackHandler]
+            ) -> BaseChatModel:
+        model = AiModel(model)
+        key = (model, self._hash_key(api_key), temperature)
+
+        with self._lock:
+            prototype = self._models.get(key)
+        if prototype is None:
+            prototype = self._create(model, api_key, temperature)
+            with self._lock:
+                prototype = self._models.setdefault(key, prototype)
+
+        shared_fields = {
+            name: getattr(prototype, name)
+            for name, field in prototype.__fields__.items()
+            if field.field_info.exclude or isinstance(getattr(prototype, name), BaseModel)
+        }
+        callbacks = [*callbacks, RateLimitCallbackHandler(self._get_rate_limiter(model, api_key))]
+        semaphore = self._concurrency_limits.get(AiModel.get_provider(model))
+        if semaphore is not None:
+            callbacks.append(ConcurrencyLimitCallbackHandler(semaphore))
+
+        return prototype.copy(exclude=set(shared_fields), update={**shared_fields, 'callbacks': callbacks})
+
+    def _create(self, model: AiModel, api_key: str | None, temperature: float | None) -> BaseChatModel:
+        fallback = AiModel.get_fallback(model) if os.getenv('LLM_HEDGING', 'false').lower() == 'true' else None
+        hedge_after = os.getenv('LLM_HEDGE_AFTER')
+
+        return ResilientChatModel(
+            primary=self._create_client(model, api_key, temperature),
+            fallback=self._create_client(fallback, api_key, temperature) if fallback is not None else None,
+            deadline=self._get_deadline(),
+            max_retries=int(os.getenv('LLM_MAX_RETRIES', 3)),
+            retry_base_delay=float(os.getenv('LLM_RETRY_BASE_DELAY', 1)),
+            retry_max_delay=float(os.getenv('LLM_RETRY_MAX_DELAY', 30)),
+            hedge_after=float(hedge_after) if hedge_after else None,
+            cache=LlmCacheFactory.get_cache_for_temperature(temperature)
+        )
+
+    def _create_client(self, model: AiModel, api_key: str | None, temperature: float | None) -> BaseChatModel:
+        match AiModel.get_provider(model):
+            case AiProvider.OPEN_AI:
+                return PromptCachingChatOpenAI(
+                    api_key=api_key,
+                    model=AiModel.get_tech_name(model),
+                    temperature=temperature,
+                    streaming=True,
+                    client=self._get_openai_client(api_key).chat.completions,
+                    cache=False
+                )
+            case AiProvider.ANTHROPIC:
+                llm = PromptCachingChatAnthropic(
+                    api_key=api_key,
+                    model_name=AiModel.get_tech_name(model),
+                    temperature=temperature,
+                    streaming=True,
+                    cache=False
+                )
+                object.__setattr__(llm, '_client', self._get_anthropic_client(api_key))
+                return llm
+            case AiProvider.OLLAMA:
+                return ChatOllama(
+                    base_url=os.getenv('OLLAMA_URL', 'http://localhost:11434'),
+                    model=AiModel.get_tech_name(model),
+                    temperature=temperature,
+                    timeout=int(self._get_deadline()),
+                    keep_alive=os.getenv('OLLAMA_KEEP_ALIVE', '30m'),
+                    cache=False
+                )
+            case AiProvider.FAKE:
+                return FakeChatModel(
+                    model=AiModel.get_tech_name(model),
+                    seed=int(os.getenv('FAKE_LLM_SEED', 0)),
+                    responses=self._get_fake_responses(),
+                    latency=float(os.getenv('FAKE_LLM_LATENCY', 0.5)),
+                    latency_jitter=float(os.getenv('FAKE_LLM_LATENCY_JITTER', 0.1)),
+                    tokens_per_second=float(os.getenv('FAKE_LLM_TOKENS_PER_SECOND', 50)),
+                    tool_call_rate=float(os.getenv('FAKE_LLM_TOOL_CALL_RATE', 0)),
+                    cache=False
+                )
+            case _:
+                raise ValueError(f'Unsupported model: {model}')
+
+    def close(self) -> None:
+        with self._lock:
+            for http_client in self._http_clients.values():
+                http_client.close()
+            self._http_clients.clear()
+            self._models.clear()
+            self._openai_clients.clear()
+            self._anthropic_clients.clear()
+
+    def get_rate_limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rate_limiters = list(self._rate_limiters.items())
+
+        return {f'{model.value} ({key_hash[:8]})': rate_limiter.get_stats() for (model, key_hash), rate_limiter in rate_limiters}
+
+    def _get_rate_limiter(self, model: AiModel, api_key: str | None) -> RateLimiter:
+        key = (model, self._hash_key(api_key))
+        with self._lock:
+            if key not in self._rate_limiters:
+                provider = AiModel.get_provider(model)
+                self._rate_limiters[key] = RateLimiter(
+                    rpm=int(os.getenv(f'LLM_RPM_{provider.name}', 0)),
+                    tpm=int(os.getenv(f'LLM_TPM_{provider.name}', 0))
+                )
+            return self._rate_limiters[key]
+
+    def _get_openai_client(self, api_key: str | None) -> openai.OpenAI:
+        key = self._hash_key(api_key)
+        with self._lock:
+            if key not in self._openai_clients:
+                self._openai_clients[key] = openai.OpenAI(
+                    api_key=api_key,
+                    max_retries=0,
+                    http_client=self._get_http_client(AiProvider.OPEN_AI)
+                )
+            return self._openai_clients[key]
+
+    def _get_anthropic_client(self, api_key: str | None) -> anthropic.Anthropic:
+        key = self._hash_key(api_key)
+        with self._lock:
+            if key not in self._anthropic_clients:
+                self._anthropic_clients[key] = anthropic.Anthropic(
+                    api_key=api_key,
+                    max_retries=0,
+                    http_client=self._get_http_client(AiProvider.ANTHROPIC)
+                )
+            return self._anthropic_clients[key]
+
+    @staticmethod
+    def _get_deadline() -> float:
+        return float(os.getenv('LLM_CALL_DEADLINE', 120))
+
+    @staticmethod
+    def _get_fake_responses() -> List[str]:
+        path = os.getenv('FAKE_LLM_RESPONSES_PATH')
+        if not path:
+            return []
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+
+    def _get_http_client(self, provider: AiProvider) -> httpx.Client:
+        if provider not in self._http_clients:
+            max_connections = int(os.getenv(f'LLM_MAX_CONNECTIONS_{provider.name}', 10))
+            self._http_clients[provider] = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=float(os.getenv('LLM_KEEPALIVE_EXPIRY', 120))
+                ),
+                timeout=httpx.Timeout(self._get_deadline(), connect=10.0, pool=None)
+            )
+        return self._http_clients[provider]
+
+    @staticmethod
+    def _hash_key(api_key: str | None) -> str:
+        return hashlib.sha256((api_key or '').encode('utf-8')).hexdigest()
@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Any, Dict, List
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from enums.AgentPurpose import AgentPurpose
+from enums.AiModel import AiModel
+from simulation.HearingMetrics import HearingMetrics
+
+CHARACTERS_PER_TOKEN = 4
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    def __init__(self, metrics: HearingMetrics, agent_purpose: AgentPurpose, model: AiModel) -> None:
+        self.metrics = metrics
+        self.agent_purpose = agent_purpose
+        self.model = model
+        self._runs: Dict[UUID, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self,
+                            serialized: Dict[str, Any],
+                            messages: List[List[BaseMessage]],
+                            *,
+                            run_id: UUID,
+                            **kwargs: Any
+                            ) -> None:
+        prompt_length = sum(len(str(message.content)) for batch in messages for message in batch)
+        with self._lock:
+            self._runs[run_id] = {
+                'started_at': time.time(),
+                'prompt_tokens': prompt_length // CHARACTERS_PER_TOKEN,
+                'completion_tokens': 0
+            }
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            if run_id in self._runs:
+                self._runs[run_id]['completion_tokens'] += 1
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+
+        prompt_tokens = run['prompt_tokens']
+        completion_tokens = run['completion_tokens']
+        token_usage = (response.llm_output or {}).get('token_usage') or self._get_generation_usage(response)
+        if token_usage:
+            prompt_tokens = token_usage.get('prompt_tokens', prompt_tokens)
+            completion_tokens = token_usage.get('completion_tokens', completion_tokens)
+        elif completion_tokens == 0:
+            completion_tokens = sum(
+                len(generation.text) for generations in response.generations for generation in generations
+            ) // CHARACTERS_PER_TOKEN
+
+        self.metrics.record_llm_call(
+            self.agent_purpose,
+            self.model,
+            time.time() - run['started_at'],
+            prompt_tokens,
+            completion_tokens,
+            token_usage.get('cached_tokens', 0),
+            token_usage.get('cache_write_tokens', 0),
+            self._is_fallback(response)
+        )
+
+    @staticmethod
+    def _get_generation_usage(response: LLMResult) -> Dict[str, int]:
+        for generations in response.generations:
+            for generation in generations:
+                usage = (generation.generation_info or {}).get('usage')
+                if usage:
+                    return usage
+        return {}
+
+    @staticmethod
+    def _is_fallback(response: LLMResult) -> bool:
+        return any(
+            (generation.generation_info or {}).get('fallback', False)
+            for generations in response.generations for generation in generations
+        )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._runs.pop(run_id, None)
@@ -0,0 +1,17 @@
+from typing import List
+
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+from langchain_core.embeddings import Embeddings
+
+
+class OnnxEmbeddings(Embeddings):
+    MODEL_NAME = ONNXMiniLM_L6_V2.MODEL_NAME
+
+    def __init__(self) -> None:
+        self._embedding_function = ONNXMiniLM_L6_V2()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [list(map(float, embedding)) for embedding in self._embedding_function(texts)]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.tools import BaseTool
+
+from crew.CachedEmbeddings import CachedEmbeddings
+from simulation.PrecedentStore import PrecedentStore
+
+
+class PrecedentSearchTool(BaseTool):
+    name: str = 'Search court precedents'
+    description: str = (
+        'Finds past court hearings similar to the described case and returns their case description, '
+        'the arguments of the prosecution and the defense and the verdict. '
+        'The input is a short description of the case or the legal question.'
+    )
+    store: PrecedentStore
+    embeddings: CachedEmbeddings
+    case_description: str
+    limit: int = 3
+    max_field_length: int = 1000
+
+    def _run(self, query: str = '', run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+        precedents = self.store.search(
+            self.embeddings.model,
+            self.embeddings.embed_query(query.strip() or self.case_description),
+            self.limit,
+            PrecedentStore.get_case_key(self.case_description)
+        )
+        if not precedents:
+            return 'No similar precedents were found.'
+
+        return '\n\n'.join(
+            f'Precedent #{number} ({precedent.court_type} case, similarity {1 - distance:.2f}):\n'
+            f'Case: {self._shorten(precedent.case_description)}\n'
+            f'Arguments: {self._shorten(precedent.arguments)}\n'
+            f'Verdict: {self._shorten(precedent.verdict)}'
+            + (f'\nJury verdict: {precedent.jury_verdict}' if precedent.jury_verdict else '')
+            for number, (precedent, distance) in enumerate(precedents, start=1)
+        )
+
+    def _shorten(self, text: str) -> str:
+        if len(text) <= self.max_field_length:
+            return text
+
+        return text[:self.max_field_length].rsplit(' ', 1)[0] + '...'
@@ -0,0 +1,61 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk
+
+PROMPT_CACHE_BREAKPOINT = '\nCurrent Task:'
+
+
+class PromptCachingChatAnthropic(ChatAnthropic):
+    def _format_params(self, *, messages: List[BaseMessage], stop: Optional[List[str]] = None, **kwargs: Dict) -> Dict:
+        params = super()._format_params(messages=messages, stop=stop, **kwargs)
+        for message in params['messages']:
+            if message['role'] == 'user' and isinstance(message['content'], str):
+                message['content'] = self._split_cacheable_prefix(message['content'])
+                break
+
+        return params
+
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any
+                ) -> Iterator[ChatGenerationChunk]:
+        params = self._format_params(messages=messages, stop=stop, **kwargs)
+        if params.get('tools'):
+            yield from super()._stream(messages, stop, run_manager, **kwargs)
+            return
+
+        with self._client.messages.stream(**params) as stream:
+            for text in stream.text_stream:
+                chunk = ChatGenerationChunk(message=AIMessageChunk(content=text))
+                if run_manager:
+                    run_manager.on_llm_new_token(text, chunk=chunk)
+                yield chunk
+            usage = stream.get_final_message().usage
+
+        cached_tokens = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cache_write_tokens = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(content=''),
+            generation_info={'usage': {
+                'prompt_tokens': usage.input_tokens + cached_tokens + cache_write_tokens,
+                'completion_tokens': usage.output_tokens,
+                'cached_tokens': cached_tokens,
+                'cache_write_tokens': cache_write_tokens
+            }}
+        )
+
+    @staticmethod
+    def _split_cacheable_prefix(text: str) -> str | List[Dict[str, Any]]:
+        prefix, breakpoint, suffix = text.partition(PROMPT_CACHE_BREAKPOINT)
+        if not breakpoint or not prefix.strip():
+            return text
+
+        return [
+            {'type': 'text', 'text': prefix, 'cache_control': {'type': 'ephemeral'}},
+            {'type': 'text', 'text': breakpoint + suffix}
+        ]
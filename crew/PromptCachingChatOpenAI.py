@@ -0,0 +1,50 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_openai import ChatOpenAI
+from langchain_openai.chat_models.base import _convert_delta_to_message_chunk
+
+
+class PromptCachingChatOpenAI(ChatOpenAI):
+    def _stream(self,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs: Any
+                ) -> Iterator[ChatGenerationChunk]:
+        message_dicts, params = self._create_message_dicts(messages, stop)
+        params = {**params, **kwargs, 'stream': True, 'stream_options': {'include_usage': True}}
+
+        default_chunk_class = AIMessageChunk
+        for chunk in self.client.create(messages=message_dicts, **params):
+            if not isinstance(chunk, dict):
+                chunk = chunk.dict()
+            if chunk.get('usage'):
+                yield ChatGenerationChunk(
+                    message=default_chunk_class(content=''),
+                    generation_info={'usage': self._get_usage(chunk['usage'])}
+                )
+            if len(chunk['choices']) == 0:
+                continue
+
+            choice = chunk['choices'][0]
+            message_chunk = _convert_delta_to_message_chunk(choice['delta'], default_chunk_class)
+            default_chunk_class = message_chunk.__class__
+            generation_info = {}
+            if finish_reason := choice.get('finish_reason'):
+                generation_info['finish_reason'] = finish_reason
+            generation_chunk = ChatGenerationChunk(message=message_chunk, generation_info=generation_info or None)
+            yield generation_chunk
+            if run_manager:
+                run_manager.on_llm_new_token(generation_chunk.text, chunk=generation_chunk)
+
+    @staticmethod
+    def _get_usage(usage: Dict[str, Any]) -> Dict[str, int]:
+        return {
+            'prompt_tokens': usage.get('prompt_tokens') or 0,
+            'completion_tokens': usage.get('completion_tokens') or 0,
+            'cached_tokens': (usage.get('prompt_tokens_details') or {}).get('cached_tokens') or 0,
+            'cache_write_tokens': 0
+        }
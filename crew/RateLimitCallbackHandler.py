@@ -0,0 +1,45 @@
+from typing import Any, Dict, List
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+from tenacity import RetryCallState
+
+from crew.MetricsCallbackHandler import CHARACTERS_PER_TOKEN
+from crew.RateLimiter import RateLimiter
+
+THROTTLING_STATUS_CODES = (429, 529)
+
+
+class RateLimitCallbackHandler(BaseCallbackHandler):
+    def __init__(self, rate_limiter: RateLimiter) -> None:
+        self.rate_limiter = rate_limiter
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[BaseMessage]], **kwargs: Any) -> None:
+        prompt_length = sum(len(str(message.content)) for batch in messages for message in batch)
+        self.rate_limiter.acquire(prompt_length // CHARACTERS_PER_TOKEN)
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        completion_length = sum(len(generation.text) for generations in response.generations for generation in generations)
+        self.rate_limiter.consume(completion_length // CHARACTERS_PER_TOKEN)
+        self.rate_limiter.on_success()
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        self._on_error(error)
+
+    def on_retry(self, retry_state: RetryCallState, **kwargs: Any) -> None:
+        if retry_state.outcome is not None and retry_state.outcome.failed:
+            self._on_error(retry_state.outcome.exception())
+
+    def _on_error(self, error: BaseException) -> None:
+        if getattr(error, 'status_code', None) not in THROTTLING_STATUS_CODES:
+            return
+
+        retry_after = None
+        response = getattr(error, 'response', None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get('retry-after'))
+            except (TypeError, ValueError):
+                retry_after = None
+        self.rate_limiter.on_throttled(retry_after)
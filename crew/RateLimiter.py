@@ -0,0 +1,71 @@
+import threading
+import time
+from typing import Any, Dict
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def reserve(self, amount: float, now: float, rate_factor: float) -> float:
+        refill_rate = self.refill_per_second * rate_factor
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * refill_rate)
+        self._updated_at = now
+        self._tokens -= min(amount, self.capacity)
+
+        return max(0.0, -self._tokens / refill_rate)
+
+
+class RateLimiter:
+    MIN_RATE_FACTOR = 0.1
+    RECOVERY_STEP = 0.05
+    THROTTLE_BACKOFF = 5.0
+
+    def __init__(self, rpm: int, tpm: int) -> None:
+        self._requests = TokenBucket(rpm, rpm / 60) if rpm > 0 else None
+        self._tokens = TokenBucket(tpm, tpm / 60) if tpm > 0 else None
+        self._rate_factor = 1.0
+        self._blocked_until = 0.0
+        self._stats = {'requests': 0, 'waited': 0.0, 'throttled': 0}
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1, now, self._rate_factor))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens, now, self._rate_factor))
+            self._stats['requests'] += 1
+            self._stats['waited'] += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def consume(self, tokens: int) -> None:
+        if self._tokens is None:
+            return
+        with self._lock:
+            self._tokens.reserve(tokens, time.monotonic(), self._rate_factor)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._rate_factor = min(1.0, self._rate_factor + self.RECOVERY_STEP)
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            self._rate_factor = max(self.MIN_RATE_FACTOR, self._rate_factor / 2)
+            self._blocked_until = max(
+                self._blocked_until,
+                time.monotonic() + (retry_after if retry_after is not None else self.THROTTLE_BACKOFF)
+            )
+            self._stats['throttled'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'rate_factor': self._rate_factor}
@@ -0,0 +1,181 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, List, Optional
+
+import anthropic
+import httpx
+import openai
+import requests
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from langchain_core.pydantic_v1 import PrivateAttr
+from tenacity import (
+    RetryCallState, Retrying, retry_if_exception, stop_after_attempt, stop_after_delay, wait_exponential_jitter
+)
+
+from exceptions.AbandonedLlmCallException import AbandonedLlmCallException
+
+TRANSIENT_STATUS_CODES = (408, 409, 429)
+TRANSIENT_ERRORS = (
+    TimeoutError,
+    httpx.TransportError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    openai.APIConnectionError,
+    anthropic.APIConnectionError
+)
+
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv('LLM_CALL_WORKERS', 32)), thread_name_prefix='llm-call')
+
+
+def is_transient_error(error: BaseException) -> bool:
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+
+    status_code = getattr(error, 'status_code', None)
+    return status_code is not None and (status_code in TRANSIENT_STATUS_CODES or status_code >= 500)
+
+
+class AttemptRunManager:
+    def __init__(self, run_manager: Optional[CallbackManagerForLLMRun]) -> None:
+        self.run_manager = run_manager
+        self.abandoned = False
+
+    def abandon(self) -> None:
+        self.abandoned = True
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        if self.abandoned:
+            raise AbandonedLlmCallException()
+        if self.run_manager is not None:
+            self.run_manager.on_llm_new_token(token, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if self.run_manager is None:
+            return lambda *args, **kwargs: None
+
+        return getattr(self.run_manager, name)
+
+
+class ResilientChatModel(BaseChatModel):
+    primary: BaseChatModel
+    fallback: Optional[BaseChatModel] = None
+    deadline: float = 120.0
+    max_retries: int = 3
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    hedge_after: Optional[float] = None
+    hedge_min_samples: int = 20
+    _latencies: Deque[float] = PrivateAttr(default_factory=lambda: deque(maxlen=200))
+
+    @property
+    def _llm_type(self) -> str:
+        return f'resilient-{self.primary._llm_type}'
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return self.primary._identifying_params
+
+    def _generate(self,
+                  messages: List[BaseMessage],
+                  stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs: Any
+                  ) -> ChatResult:
+        deadline_at = time.monotonic() + self.deadline
+        backoff = wait_exponential_jitter(initial=self.retry_base_delay, max=self.retry_max_delay)
+        retrying = Retrying(
+            stop=stop_after_attempt(self.max_retries + 1) | stop_after_delay(self.deadline),
+            wait=lambda retry_state: min(backoff(retry_state), max(0.0, deadline_at - time.monotonic())),
+            retry=retry_if_exception(is_transient_error),
+            before_sleep=self._before_sleep(run_manager),
+            reraise=True
+        )
+
+        return retrying(self._generate_with_hedging, messages, stop, run_manager, deadline_at, **kwargs)
+
+    def _generate_with_hedging(self,
+                               messages: List[BaseMessage],
+                               stop: Optional[List[str]],
+                               run_manager: Optional[CallbackManagerForLLMRun],
+                               deadline_at: float,
+                               **kwargs: Any
+                               ) -> ChatResult:
+        started_at = time.monotonic()
+        if started_at >= deadline_at:
+            raise TimeoutError(f'LLM call exceeded the deadline of {self.deadline}s')
+
+        attempts = {}
+        primary = self._submit(attempts, self.primary, messages, stop, run_manager, **kwargs)
+        pending = {primary}
+
+        hedge_after = self._get_hedge_after()
+        if self.fallback is not None and hedge_after is not None:
+            done, _ = wait(pending, timeout=min(hedge_after, deadline_at - started_at))
+            if not done:
+                pending.add(self._submit(attempts, self.fallback, messages, stop, None, **kwargs))
+
+        try:
+            error: Optional[BaseException] = None
+            while pending:
+                remaining = deadline_at - time.monotonic()
+                done, pending = wait(pending, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError(f'LLM call exceeded the deadline of {self.deadline}s')
+
+                for future in done:
+                    if future.exception() is None:
+                        if future is not primary:
+                            return self._mark_fallback(future.result())
+                        self._latencies.append(time.monotonic() - started_at)
+                        return future.result()
+                    error = future.exception()
+
+            raise error
+        finally:
+            for future, attempt_run_manager in attempts.items():
+                if not future.done():
+                    future.cancel()
+                    attempt_run_manager.abandon()
+
+    @staticmethod
+    def _submit(attempts: Dict[Future, AttemptRunManager],
+                model: BaseChatModel,
+                messages: List[BaseMessage],
+                stop: Optional[List[str]],
+                run_manager: Optional[CallbackManagerForLLMRun],
+                **kwargs: Any
+                ) -> Future:
+        attempt_run_manager = AttemptRunManager(run_manager)
+        future = _executor.submit(model._generate, messages, stop, attempt_run_manager, **kwargs)
+        attempts[future] = attempt_run_manager
+
+        return future
+
+    @staticmethod
+    def _mark_fallback(result: ChatResult) -> ChatResult:
+        for generation in result.generations:
+            generation.generation_info = {**(generation.generation_info or {}), 'fallback': True}
+
+        return result
+
+    def _get_hedge_after(self) -> Optional[float]:
+        if self.hedge_after is not None:
+            return self.hedge_after
+        if len(self._latencies) < self.hedge_min_samples:
+            return None
+
+        latencies = sorted(self._latencies)
+        return latencies[int(len(latencies) * 0.95) - 1]
+
+    @staticmethod
+    def _before_sleep(run_manager: Optional[CallbackManagerForLLMRun]):
+        def before_sleep(retry_state: RetryCallState) -> None:
+            if run_manager is not None:
+                run_manager.on_retry(retry_state)
+
+        return before_sleep
@@ -0,0 +1,19 @@
+from typing import Any, Dict, List
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+
+from enums.AgentPurpose import AgentPurpose
+from simulation.Simulation import Simulation
+
+
+class StreamingCallbackHandler(BaseCallbackHandler):
+    def __init__(self, simulation: Simulation, agent_purpose: AgentPurpose) -> None:
+        self.simulation = simulation
+        self.agent_purpose = agent_purpose
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[BaseMessage]], **kwargs: Any) -> None:
+        self.simulation.clear_draft(self.agent_purpose)
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.simulation.append_draft(self.agent_purpose, token)
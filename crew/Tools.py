@@ -1,5 +1,12 @@
+import os
+from typing import Optional
+
 from langchain_community.tools import DuckDuckGoSearchRun
 
+from crew.EmbeddingsFactory import EmbeddingsFactory
+from crew.PrecedentSearchTool import PrecedentSearchTool
+from simulation.PrecedentStore import PrecedentStore
+
 
 class ToolsFactory:
     @staticmethod
@@ -9,3 +16,21 @@ class ToolsFactory:
     @staticmethod
     def get_browserless_tool() -> None:
         pass
+
+    @staticmethod
+    def precedents_enabled() -> bool:
+        return os.getenv('PRECEDENTS_ENABLED', 'true').lower() == 'true'
+
+    @classmethod
+    def get_precedent_tool(cls, case_description: str, openai_key: str | None = None) -> Optional[PrecedentSearchTool]:
+        embeddings = EmbeddingsFactory.get_embeddings(openai_key)
+        if embeddings is None or not cls.precedents_enabled():
+            return None
+
+        return PrecedentSearchTool(
+            store=PrecedentStore(),
+            embeddings=embeddings,
+            case_description=case_description,
+            limit=int(os.getenv('PRECEDENT_LIMIT', 3)),
+            max_field_length=int(os.getenv('PRECEDENT_MAX_FIELD_LENGTH', 1000))
+        )
@@ -1,5 +1,9 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 
+from enums.Verdict import Verdict
+
 
 class WelcomeObject(BaseModel):
     welcome_text: str
@@ -8,3 +12,47 @@ class WelcomeObject(BaseModel):
 class OutputModel(BaseModel):
     liczba: int
     tekst: str
+
+
+class JuryVote(BaseModel):
+    juror: int
+    verdict: Verdict
+    statement: str
+
+
+class JuryVerdict(BaseModel):
+    verdict: Verdict
+    votes: List[JuryVote]
+
+    @classmethod
+    def from_votes(cls, votes: List[JuryVote]) -> 'JuryVerdict':
+        guilty = sum(1 for vote in votes if vote.verdict == Verdict.GUILTY)
+        not_guilty = sum(1 for vote in votes if vote.verdict == Verdict.NOT_GUILTY)
+
+        if guilty > not_guilty:
+            verdict = Verdict.GUILTY
+        elif not_guilty > guilty:
+            verdict = Verdict.NOT_GUILTY
+        else:
+            verdict = Verdict.UNDECIDED
+
+        return cls(verdict=verdict, votes=sorted(votes, key=lambda vote: vote.juror))
+
+    def count(self, verdict: Verdict) -> int:
+        return sum(1 for vote in self.votes if vote.verdict == verdict)
+
+    def describe(self) -> str:
+        return (
+            f'The jury finds the defendant {self.verdict.value.lower()} '
+            f'({self.count(Verdict.GUILTY)} guilty, '
+            f'{self.count(Verdict.NOT_GUILTY)} not guilty, '
+            f'{self.count(Verdict.UNDECIDED)} undecided).'
+        )
+
+
+class Precedent(BaseModel):
+    case_description: str
+    court_type: str
+    arguments: str
+    verdict: str
+    jury_verdict: Optional[str] = None
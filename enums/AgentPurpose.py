@@ -8,3 +8,10 @@ class AgentPurpose(str, Enum):
     DEFENSE = 'Defense'
     PROSECUTOR = 'Prosecutor'
     JURY = 'Jury'
+
+    @classmethod
+    def get_settings_key(cls, agent_purpose: 'AgentPurpose') -> str:
+        if agent_purpose == cls.CREW_SUPERVISOR:
+            return 'supervisor'
+
+        return agent_purpose.value.lower()
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List
+from typing import List, Tuple
 
 from enums.AiProvider import AiProvider
 
@@ -12,6 +12,7 @@ class AiModel(str, Enum):
     ANTHROPIC_CLAUDE_SONNET = 'Claude Sonnet'
     ANTHROPIC_CLAUDE_OPUS = 'Claude Opus'
     LLAMA_3_8B = 'Llama 3 (8B)'
+    FAKE_COURT = 'Fake (offline)'
 
     @classmethod
     def get_all_by_provider(cls, provider: AiProvider) -> List[str]:
@@ -28,10 +29,20 @@ class AiModel(str, Enum):
             ],
             AiProvider.OLLAMA: [
                 cls.LLAMA_3_8B.value
+            ],
+            AiProvider.FAKE: [
+                cls.FAKE_COURT.value
             ]
         }
         return model_map.get(provider, [])
 
+    @classmethod
+    def get_provider(cls, ai_model: 'AiModel') -> AiProvider | None:
+        for provider in AiProvider:
+            if ai_model in cls.get_all_by_provider(provider):
+                return provider
+        return None
+
     @classmethod
     def get_tech_name(cls, ai_model: 'AiModel') -> str:
         tech_name_map = {
@@ -41,10 +52,43 @@ class AiModel(str, Enum):
             cls.ANTHROPIC_CLAUDE_HAIKU: 'claude-3-haiku-20240307',
             cls.ANTHROPIC_CLAUDE_SONNET: 'claude-3-sonnet-20240229',
             cls.ANTHROPIC_CLAUDE_OPUS: 'claude-3-opus-20240229',
-            cls.LLAMA_3_8B: 'llama3'
+            cls.LLAMA_3_8B: 'llama3',
+            cls.FAKE_COURT: 'fake-court'
         }
         return tech_name_map.get(ai_model, '')
 
+    @classmethod
+    def get_fallback(cls, ai_model: 'AiModel') -> 'AiModel | None':
+        fallback_map = {
+            cls.OPEN_AI_GPT_4_TURBO: cls.OPEN_AI_GPT_35_TURBO,
+            cls.OPEN_AI_GPT_4_O: cls.OPEN_AI_GPT_35_TURBO,
+            cls.ANTHROPIC_CLAUDE_SONNET: cls.ANTHROPIC_CLAUDE_HAIKU,
+            cls.ANTHROPIC_CLAUDE_OPUS: cls.ANTHROPIC_CLAUDE_HAIKU
+        }
+        return fallback_map.get(ai_model)
+
+    @classmethod
+    def get_token_prices(cls, ai_model: 'AiModel') -> Tuple[float, float]:
+        token_prices_map = {
+            cls.OPEN_AI_GPT_35_TURBO: (0.5, 1.5),
+            cls.OPEN_AI_GPT_4_TURBO: (10.0, 30.0),
+            cls.OPEN_AI_GPT_4_O: (5.0, 15.0),
+            cls.ANTHROPIC_CLAUDE_HAIKU: (0.25, 1.25),
+            cls.ANTHROPIC_CLAUDE_SONNET: (3.0, 15.0),
+            cls.ANTHROPIC_CLAUDE_OPUS: (15.0, 75.0)
+        }
+        return token_prices_map.get(ai_model, (0.0, 0.0))
+
+    @classmethod
+    def get_prompt_cache_price_factors(cls, ai_model: 'AiModel') -> Tuple[float, float]:
+        match cls.get_provider(ai_model):
+            case AiProvider.ANTHROPIC:
+                return 0.1, 1.25
+            case AiProvider.OPEN_AI:
+                return 0.5, 1.0
+            case _:
+                return 1.0, 1.0
+
     @classmethod
     def index_of(cls, model: 'AiModel', provider: AiProvider) -> int:
         try:
@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 from typing import List
 
@@ -6,14 +7,19 @@ class AiProvider(str, Enum):
     OPEN_AI = 'OpenAI'
     ANTHROPIC = 'Anthropic'
     OLLAMA = 'Ollama'
+    FAKE = 'Fake'
 
     @classmethod
     def get_all(cls: 'AiProvider') -> List[str]:
-        return [
+        providers = [
             AiProvider.OPEN_AI.value,
             AiProvider.ANTHROPIC.value,
             AiProvider.OLLAMA.value
         ]
+        if os.getenv('FAKE_LLM_ENABLED', 'false').lower() == 'true':
+            providers.append(AiProvider.FAKE.value)
+
+        return providers
 
     @classmethod
     def get_by_name(cls, name: str) -> 'AiProvider':
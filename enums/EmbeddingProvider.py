@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class EmbeddingProvider(str, Enum):
+    LOCAL = 'local'
+    OPEN_AI = 'openai'
+    OLLAMA = 'ollama'
+    FAKE = 'fake'
+    NONE = 'none'
+
+    @classmethod
+    def get_by_value(cls, value: str | None) -> 'EmbeddingProvider':
+        try:
+            return cls(value.lower())
+        except (AttributeError, ValueError):
+            return cls.NONE
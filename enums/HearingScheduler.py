@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class HearingScheduler(str, Enum):
+    HIERARCHICAL = 'hierarchical'
+    PLAN = 'plan'
+
+    @classmethod
+    def get_by_value(cls, value: str | None) -> 'HearingScheduler':
+        try:
+            return cls(value.lower())
+        except (AttributeError, ValueError):
+            return cls.PLAN
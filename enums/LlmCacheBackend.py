@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class LlmCacheBackend(str, Enum):
+    MEMORY = 'memory'
+    SQLITE = 'sqlite'
+    NONE = 'none'
+
+    @classmethod
+    def get_by_value(cls, value: str | None) -> 'LlmCacheBackend':
+        try:
+            return cls(value.lower())
+        except (AttributeError, ValueError):
+            return cls.MEMORY
@@ -0,0 +1,14 @@
+from enum import Enum
+from typing import List
+
+
+class SimulationStatus(str, Enum):
+    QUEUED = 'Queued'
+    RUNNING = 'Running'
+    FINISHED = 'Finished'
+    FAILED = 'Failed'
+    CANCELLED = 'Cancelled'
+
+    @classmethod
+    def get_active(cls) -> List['SimulationStatus']:
+        return [cls.QUEUED, cls.RUNNING]
@@ -0,0 +1,19 @@
+import re
+from enum import Enum
+
+VOTE_LINE = re.compile(r'^VOTE:\s*(GUILTY|NOT[\s_-]*GUILTY|UNDECIDED)\.?$', re.IGNORECASE)
+
+
+class Verdict(str, Enum):
+    GUILTY = 'Guilty'
+    NOT_GUILTY = 'Not guilty'
+    UNDECIDED = 'Undecided'
+
+    @classmethod
+    def from_vote(cls, text: str) -> 'Verdict':
+        lines = [line.strip(' \t*_`') for line in text.strip().splitlines() if line.strip(' \t*_`')]
+        match = VOTE_LINE.match(lines[-1]) if lines else None
+        if match is None:
+            return cls.UNDECIDED
+
+        return cls[re.sub(r'[\s_-]+', '_', match.group(1).upper())]
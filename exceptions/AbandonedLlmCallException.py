@@ -0,0 +1,3 @@
+class AbandonedLlmCallException(Exception):
+    def __init__(self) -> None:
+        super().__init__('LLM call was abandoned after a hedge, fallback or deadline')
@@ -0,0 +1,3 @@
+class InvalidHearingPlanException(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(f'Invalid hearing plan: {message}')
@@ -0,0 +1,3 @@
+class InvalidTaskTemplateException(Exception):
+    def __init__(self, name: str, message: str) -> None:
+        super().__init__(f'Invalid task template "{name}": {message}')
@@ -0,0 +1,4 @@
+class SimulationCancelledException(Exception):
+    def __init__(self, simulation_id: str) -> None:
+        super().__init__(f'Simulation {simulation_id} has been cancelled')
+        self.simulation_id = simulation_id
@@ -1,14 +1,17 @@
+import uuid
+
 import streamlit as st
-from crewai.tasks.task_output import TaskOutput
 from streamlit_extras.grid import grid as grid_layout
 from streamlit_extras.row import row
 
-from crew.Agents import AgentsFactory
-from crew.Crew import CourtCrew
-from crew.Tasks import TasksFactory
-from crew.Tools import ToolsFactory
+from enums.AgentPurpose import AgentPurpose
 from enums.CourtCaseType import CourtCaseType
+from enums.SimulationStatus import SimulationStatus
+from simulation.CheckpointStore import CheckpointStore
+from simulation.Simulation import Simulation
+from simulation.SimulationRunner import SimulationRunner
 from state.AppState import AppState
+from state.HearingConfig import HearingConfig
 
 st.set_page_config(
     page_title='Court',
@@ -17,31 +20,53 @@ st.set_page_config(
     initial_sidebar_state='auto'
 )
 
+SIMULATION_POLL_INTERVAL = 0.5
+TRANSCRIPT_TAIL_LIMIT = 20
+
+
+def message_view(agent_purpose: AgentPurpose, message: str) -> None:
+    with st.chat_message(agent_purpose.value):
+        st.write(message)
 
-def chat_view(container_name: str, container, agent_output: TaskOutput | None) -> None:
-    key_string = f'{AppState.get_value('task_order_counter')}{container_name}_chat_message'
 
-    if AppState.get_value(key_string) is None:
-        AppState.set_value(key_string, [])
+def chat_view(agent_purpose: AgentPurpose, simulation: Simulation | None) -> None:
+    if simulation is None:
         return
 
-    if isinstance(agent_output, TaskOutput):
-        AppState.set_value(key_string, AppState.get_value(key_string) + [
-            {'role': container_name, 'content': agent_output.result()}])
+    transcript = simulation.get_transcript(agent_purpose)
+    cursor = len(transcript)
+    for message in transcript.read(0, cursor):
+        message_view(agent_purpose, message)
+
+    if simulation.is_active():
+        st.experimental_fragment(live_chat_view, run_every=SIMULATION_POLL_INTERVAL)(agent_purpose, simulation, cursor)
+
 
-    message = AppState.get_value(key_string)
-    if message is not None and message != []:
-        with container.chat_message(key_string):
-            st.write(message[-1]['content'])  # Display only newest message
+def live_chat_view(agent_purpose: AgentPurpose, simulation: Simulation, cursor: int) -> None:
+    transcript = simulation.get_transcript(agent_purpose)
+    messages = transcript.read(cursor)
+    for message in messages:
+        message_view(agent_purpose, message)
 
-        AppState.set_value('task_order_counter', AppState.get_value('task_order_counter') + 1)
+    draft = transcript.get_draft()
+    if draft != '':
+        message_view(agent_purpose, f'{draft} ▌')
 
+    if len(messages) >= TRANSCRIPT_TAIL_LIMIT:
+        st.rerun()
 
-def chat_view_wrapper(container_name, container):
-    def wrapper(agent_output):
-        chat_view(container_name, container, agent_output)
 
-    return wrapper
+def run_hearing(config: HearingConfig, simulation: Simulation, hearing_id: str, resume: bool) -> str:
+    from crew.Hearing import HearingFactory
+
+    return HearingFactory().get_hearing(config, simulation, hearing_id, resume).run()
+
+
+def live_status_view(simulation: Simulation) -> None:
+    if not simulation.is_active():
+        st.rerun()
+
+    st.info(f'Simulation status: {simulation.status.value}')
 
 
 class Court:
@@ -50,10 +75,14 @@ class Court:
     prosecution_container: st.container
     defense_container: st.container
     jury_container: st.container
+    simulation: Simulation | None = None
 
     def __init__(self):
         self.view()
 
+    def get_simulation(self) -> Simulation | None:
+        return SimulationRunner().get(AppState.get_value('simulation_id'))
+
     def empty_row(self, grid: grid_layout = None) -> None:
         if grid is None:
             with row(1).container():
@@ -81,90 +110,99 @@ class Court:
         self.judge_container = grid.container(border=True, height=500)
         with self.judge_container:
             st.subheader('Judge :judge:')
-            chat_view('judge', self.judge_container, None)
+            chat_view(AgentPurpose.JUDGE, self.simulation)
 
     def witness_view(self, grid: grid_layout):
         self.witness_container = grid.container(border=True, height=500)
         with self.witness_container:
             st.subheader('Witness :adult:')
-            chat_view('witness', self.witness_container, None)
+            chat_view(AgentPurpose.WITNESS, self.simulation)
 
     def prosecution_view(self, grid: grid_layout):
         self.prosecution_container = grid.container(border=True, height=500)
         with self.prosecution_container:
             st.subheader('Prosecution :crossed_swords:')
-            chat_view('prosecution', self.prosecution_container, None)
+            chat_view(AgentPurpose.PROSECUTOR, self.simulation)
 
     def defense_view(self, grid: grid_layout):
         self.defense_container = grid.container(border=True, height=500)
         with self.defense_container:
             st.subheader('Defense :shield:')
-            chat_view('defense', self.defense_container, None)
+            chat_view(AgentPurpose.DEFENSE, self.simulation)
 
     def jury_view(self, grid: grid_layout):
         self.jury_container = grid.container(border=True, height=500)
         with self.jury_container:
             st.subheader('Jury :memo:')
-            chat_view('jury', self.jury_container, None)
+            chat_view(AgentPurpose.JURY, self.simulation)
 
     def clear_simulation(self):
-        for container_name in ['judge', 'witness', 'prosecution', 'defense', 'jury']:
-            AppState.clear(f'{container_name}_chat_message')
+        SimulationRunner().remove(AppState.get_value('simulation_id'))
+        self.drop_checkpoint()
+        AppState.clear('simulation_id')
+        AppState.clear('hearing_id')
         AppState.clear('case_description')
         AppState.clear('disable_start_simulation_button')
-        AppState.clear('task_order_counter')
 
-    def start_simulation(self):
+    def cancel_simulation(self):
+        SimulationRunner().cancel(AppState.get_value('simulation_id'))
+        self.drop_checkpoint()
+
+    def drop_checkpoint(self):
+        hearing_id = AppState.get_value('hearing_id')
+        if hearing_id is not None:
+            CheckpointStore().clear(hearing_id)
+
+    def start_simulation(self, resume: bool = False):
+        if AppState.get_value('hearing_id') is None:
+            AppState.set_value('hearing_id', str(uuid.uuid4()))
+
         AppState.set_value('disable_start_simulation_button', True)
-        AppState.set_value('task_order_counter', 0)
-        agents_factory = AgentsFactory()
-        tasks_factory = TasksFactory()
-        tools_factory = ToolsFactory()
-
-        judge_agent = agents_factory.judge_agent()
-        # judge_agent.tools = [
-        #     tools_manager.get_duckduck_go_tool()
-        # ]
-        witness_agent = agents_factory.witness_agent()
-        prosecution_agent = agents_factory.prosecution_agent()
-        # prosecution_agent.tools = [
-        #     tools_manager.get_duckduck_go_tool()
-        # ]
-        defense_agent = agents_factory.defense_agent()
-        # defense_agent.tools = [
-        #     tools_manager.get_duckduck_go_tool()
-        # ]
-
-        judge_tasks = tasks_factory.get_judge_tasks(
-            judge_agent,
-            chat_view_wrapper('judge', self.judge_container)
-        )
-        witness_tasks = tasks_factory.get_witness_task(
-            witness_agent,
-            chat_view_wrapper('witness', self.witness_container)
-        )
-        prosecution_tasks = tasks_factory.get_prosecution_task(
-            prosecution_agent,
-            chat_view_wrapper('prosecution', self.prosecution_container)
-        )
-        defense_tasks = tasks_factory.get_defense_task(
-            defense_agent,
-            chat_view_wrapper('defense', self.defense_container)
-        )
-
-        if AppState.get_value('court_type') == CourtCaseType.CRIMINAL:
-            jury_agent = agents_factory.jury_agent()
-            jury_tasks = tasks_factory.get_jury_tasks(jury_agent, chat_view_wrapper('jury', self.jury_container))
-            agents = [judge_agent, jury_agent, witness_agent, prosecution_agent, defense_agent]
-            tasks = [*judge_tasks, *jury_tasks, *witness_tasks, *prosecution_tasks, *defense_tasks]
+        config = HearingConfig.from_app_state()
+        hearing_id = AppState.get_value('hearing_id')
+        simulation = Simulation()
+        SimulationRunner().submit(simulation, lambda: run_hearing(config, simulation, hearing_id, resume))
+        AppState.set_value('simulation_id', simulation.id)
+
+    def status_view(self, simulation: Simulation | None) -> None:
+        if simulation is None:
+            return
+
+        if simulation.status == SimulationStatus.FAILED:
+            st.error(f'Simulation failed: {simulation.error}')
+        elif simulation.status == SimulationStatus.CANCELLED:
+            st.warning('Simulation cancelled')
+        elif simulation.status == SimulationStatus.FINISHED:
+            st.success('Simulation finished')
         else:
-            agents = [judge_agent, witness_agent, prosecution_agent, defense_agent]
-            tasks = [*judge_tasks, *witness_tasks, *prosecution_tasks, *defense_tasks]
+            st.experimental_fragment(live_status_view, run_every=SIMULATION_POLL_INTERVAL)(simulation)
+
+    def cache_stats_view(self) -> None:
+        if self.simulation is None:
+            return
+
+        from cache.LlmCacheFactory import LlmCacheFactory
 
-        court_crew = CourtCrew().get_crew(agents=agents, tasks=tasks)
-        court_crew.kickoff()
+        cache = LlmCacheFactory.get_cache()
+        if cache is None:
+            return
+
+        stats = cache.get_stats()
+        st.caption(f'LLM cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries')
+
+    def rate_limit_stats_view(self) -> None:
+        if self.simulation is None:
+            return
+
+        from crew.LlmClientPool import LlmClientPool
+
+        for name, stats in LlmClientPool().get_rate_limiter_stats().items():
+            st.caption(f'{name}: {stats['requests']} requests, {stats['waited']:.1f}s waited, '
+                       f'{stats['throttled']} throttled, {stats['rate_factor']:.0%} rate')
 
     def view(self) -> None:
+        self.simulation = self.get_simulation()
+
         if AppState.get_value('ready_to_start_simulation') is None:
             self.invalid_settings_modal()
 
@@ -175,9 +213,16 @@ class Court:
         with st.sidebar:
             st.button('Start simulation', on_click=self.start_simulation,
                       disabled=True if AppState.get_value('disable_start_simulation_button') else False)
+            st.button('Resume simulation', on_click=self.start_simulation, kwargs={'resume': True},
+                      disabled=self.simulation is None or self.simulation.status != SimulationStatus.FAILED)
+            st.button('Cancel simulation', on_click=self.cancel_simulation,
+                      disabled=self.simulation is None or not self.simulation.is_active())
             st.button('Clear case', on_click=self.clear_simulation)
+            self.cache_stats_view()
+            self.rate_limit_stats_view()
 
         st.title("Court :speech_balloon:")
+        self.status_view(self.simulation)
         self.empty_row()
 
         if AppState.get_value('court_type') == CourtCaseType.CIVIL:
@@ -58,17 +58,13 @@ class Settings:
             st.error(message)
             return False
 
-        if self.openai_api_key_value != '':
-            message = ApiKeyValidator.is_valid_open_ai_key(self.openai_api_key_value)
-            if message is not None:
-                st.error(message)
-                return False
-
-        if self.anthropic_api_key_value != '':
-            message = ApiKeyValidator.is_valid_anthropic_key(self.anthropic_api_key_value)
-            if message is not None:
-                st.error(message)
-                return False
+        message = ApiKeyValidator.validate_keys({
+            AiProvider.OPEN_AI: self.openai_api_key_value,
+            AiProvider.ANTHROPIC: self.anthropic_api_key_value
+        })
+        if message is not None:
+            st.error(message)
+            return False
 
         return True
 
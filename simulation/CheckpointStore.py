@@ -0,0 +1,51 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict
+
+from state.SingletonMeta import SingletonMeta
+
+
+class CheckpointStore(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        database_path = os.getenv('CHECKPOINT_PATH', './storage/checkpoints.sqlite')
+        directory = os.path.dirname(database_path)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    hearing_key TEXT NOT NULL,
+                    step TEXT NOT NULL,
+                    raw_output TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (hearing_key, step)
+                )
+            ''')
+            self._connection.execute(
+                'DELETE FROM checkpoints WHERE created_at < ?',
+                (time.time() - float(os.getenv('CHECKPOINT_TTL', 7 * 86400)),)
+            )
+
+    def load(self, hearing_key: str) -> Dict[str, str]:
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT step, raw_output FROM checkpoints WHERE hearing_key = ?', (hearing_key,)
+            ).fetchall()
+        return dict(rows)
+
+    def save(self, hearing_key: str, step: str, raw_output: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO checkpoints (hearing_key, step, raw_output, created_at) VALUES (?, ?, ?, ?)',
+                (hearing_key, step, raw_output, time.time())
+            )
+
+    def clear(self, hearing_key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM checkpoints WHERE hearing_key = ?', (hearing_key,))
@@ -0,0 +1,29 @@
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+
+from simulation.CheckpointStore import CheckpointStore
+
+
+class HearingCheckpoint:
+    def __init__(self, store: CheckpointStore, hearing_id: str, resume: bool = False) -> None:
+        self.store = store
+        self.hearing_id = hearing_id
+        self._outputs = {}
+        if resume:
+            self._outputs = store.load(hearing_id)
+        else:
+            store.clear(hearing_id)
+
+    def restore(self, step: str, task: Task) -> bool:
+        if step not in self._outputs:
+            return False
+
+        raw_output = self._outputs[step]
+        task.output = TaskOutput(description=task.description, exported_output=raw_output, raw_output=raw_output)
+        return True
+
+    def save(self, step: str, task_output: TaskOutput) -> None:
+        self.store.save(self.hearing_id, step, task_output.raw_output)
+
+    def clear(self) -> None:
+        self.store.clear(self.hearing_id)
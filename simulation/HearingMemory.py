@@ -0,0 +1,68 @@
+import hashlib
+import os
+import re
+from typing import List, Set
+
+from crew.CachedEmbeddings import CachedEmbeddings
+from simulation.MemoryStore import MemoryStore
+
+
+class HearingMemory:
+    def __init__(self, store: MemoryStore, embeddings: CachedEmbeddings, hearing_key: str, case_description: str) -> None:
+        self.store = store
+        self.embeddings = embeddings
+        self.hearing_key = hearing_key
+        self.case_description = case_description
+        self.case_key = f'case:{hashlib.sha256(case_description.encode("utf-8")).hexdigest()}'
+        self.chunk_size = int(os.getenv('MEMORY_CHUNK_SIZE', 500))
+        self.max_distance = float(os.getenv('MEMORY_MAX_DISTANCE', 0.65))
+        self.limit = int(os.getenv('MEMORY_RECALL_LIMIT', 3))
+
+    def remember_case(self) -> None:
+        chunks = self._split(self.case_description)
+        if chunks:
+            self._add(self.case_key, chunks, 'Case', 'case')
+
+    def remember(self, agent_role: str, step: str, text: str) -> None:
+        chunks = self._split(text)
+        if chunks:
+            self._add(self.hearing_key, chunks, agent_role, step)
+
+    def recall(self, query: str, exclude: Set[str] | None = None) -> List[str]:
+        exclude = exclude or set()
+        results = self.store.search(
+            self.embeddings.model,
+            [self.hearing_key, self.case_key],
+            self.embeddings.embed_query(query),
+            self.limit + len(exclude)
+        )
+
+        return [
+            text for text, distance in results
+            if distance <= self.max_distance and not any(text in excluded for excluded in exclude)
+        ][:self.limit]
+
+    def clear(self) -> None:
+        self.store.delete(self.embeddings.model, self.hearing_key)
+
+    def _add(self, namespace: str, chunks: List[str], agent_role: str, step: str) -> None:
+        self.store.add(
+            self.embeddings.model,
+            namespace,
+            chunks,
+            self.embeddings.embed_documents(chunks),
+            [{'agent': agent_role, 'step': step}] * len(chunks)
+        )
+
+    def _split(self, text: str) -> List[str]:
+        chunks = []
+        current = ''
+        for sentence in re.split(r'(?<=[.!?])\s+|\n\s*\n', text.strip()):
+            if current and len(current) + len(sentence) + 1 > self.chunk_size:
+                chunks.append(current)
+                current = ''
+            current = f'{current} {sentence}'.strip()
+        if current:
+            chunks.append(current)
+
+        return chunks
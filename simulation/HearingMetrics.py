@@ -0,0 +1,95 @@
+import threading
+import time
+from typing import Any, Dict, List
+
+from enums.AgentPurpose import AgentPurpose
+from enums.AiModel import AiModel
+
+
+class HearingMetrics:
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self._agents: Dict[AgentPurpose, Dict[str, Any]] = {}
+        self._tasks: List[Dict[str, Any]] = []
+        self._last_task_finished_at = self.started_at
+        self._lock = threading.Lock()
+
+    def record_llm_call(self,
+                        agent_purpose: AgentPurpose,
+                        model: AiModel,
+                        duration: float,
+                        prompt_tokens: int,
+                        completion_tokens: int,
+                        cached_tokens: int = 0,
+                        cache_write_tokens: int = 0,
+                        fallback: bool = False
+                        ) -> None:
+        billed_model = (AiModel.get_fallback(model) or model) if fallback else model
+        input_price, output_price = AiModel.get_token_prices(billed_model)
+        cache_read_factor, cache_write_factor = AiModel.get_prompt_cache_price_factors(billed_model)
+        uncached_tokens = prompt_tokens - cached_tokens - cache_write_tokens
+        cost = (
+            (uncached_tokens + cached_tokens * cache_read_factor + cache_write_tokens * cache_write_factor) * input_price
+            + completion_tokens * output_price
+        ) / 1_000_000
+
+        with self._lock:
+            agent = self._agents.setdefault(agent_purpose, {
+                'model': model.value,
+                'llm_calls': 0,
+                'llm_time': 0.0,
+                'prompt_tokens': 0,
+                'completion_tokens': 0,
+                'cached_tokens': 0,
+                'cache_write_tokens': 0,
+                'cost': 0.0,
+                'models': {}
+            })
+            agent['llm_calls'] += 1
+            agent['llm_time'] += duration
+            agent['prompt_tokens'] += prompt_tokens
+            agent['completion_tokens'] += completion_tokens
+            agent['cached_tokens'] += cached_tokens
+            agent['cache_write_tokens'] += cache_write_tokens
+            agent['cost'] += cost
+            model_usage = agent['models'].setdefault(billed_model.value, {'llm_calls': 0, 'cost': 0.0})
+            model_usage['llm_calls'] += 1
+            model_usage['cost'] += cost
+
+    def record_task(self, agent_role: str, description: str, duration: float) -> None:
+        with self._lock:
+            self._tasks.append({'agent': agent_role, 'description': description, 'duration': duration})
+
+    def record_sequential_task(self, agent_role: str, description: str) -> None:
+        finished_at = time.time()
+        with self._lock:
+            duration = finished_at - self._last_task_finished_at
+            self._last_task_finished_at = finished_at
+        self.record_task(agent_role, description, duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            agents = {
+                purpose.value: {**agent, 'models': {name: dict(usage) for name, usage in agent['models'].items()}}
+                for purpose, agent in self._agents.items()
+            }
+            tasks = [dict(task) for task in self._tasks]
+
+        llm_time = sum(agent['llm_time'] for agent in agents.values())
+        prompt_tokens = sum(agent['prompt_tokens'] for agent in agents.values())
+        cached_tokens = sum(agent['cached_tokens'] for agent in agents.values())
+        supervisor = agents.get(AgentPurpose.CREW_SUPERVISOR.value, {})
+
+        return {
+            'wall_time': time.time() - self.started_at,
+            'llm_calls': sum(agent['llm_calls'] for agent in agents.values()),
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': sum(agent['completion_tokens'] for agent in agents.values()),
+            'cached_tokens': cached_tokens,
+            'cache_write_tokens': sum(agent['cache_write_tokens'] for agent in agents.values()),
+            'prompt_cache_hit_rate': cached_tokens / prompt_tokens if prompt_tokens else 0.0,
+            'cost': sum(agent['cost'] for agent in agents.values()),
+            'supervisor_overhead': supervisor.get('llm_time', 0.0) / llm_time if llm_time else 0.0,
+            'agents': agents,
+            'tasks': tasks
+        }
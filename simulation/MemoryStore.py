@@ -0,0 +1,66 @@
+import hashlib
+import os
+import threading
+from typing import Any, Dict, List, Tuple
+
+import chromadb
+from chromadb.config import Settings
+
+from state.SingletonMeta import SingletonMeta
+
+
+class MemoryStore(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        self._client = chromadb.PersistentClient(
+            path=os.getenv('MEMORY_PATH', './storage/memory'),
+            settings=Settings(anonymized_telemetry=False)
+        )
+        self._collections: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def add(self,
+            embeddings_model: str,
+            namespace: str,
+            texts: List[str],
+            embeddings: List[List[float]],
+            metadatas: List[Dict[str, str]]
+            ) -> None:
+        collection = self._get_collection(embeddings_model)
+        with self._lock:
+            collection.upsert(
+                ids=[hashlib.sha256(f'{namespace}:{text}'.encode('utf-8')).hexdigest() for text in texts],
+                documents=texts,
+                embeddings=embeddings,
+                metadatas=[{**metadata, 'namespace': namespace} for metadata in metadatas]
+            )
+
+    def search(self,
+               embeddings_model: str,
+               namespaces: List[str],
+               embedding: List[float],
+               limit: int
+               ) -> List[Tuple[str, float]]:
+        collection = self._get_collection(embeddings_model)
+        with self._lock:
+            result = collection.query(
+                query_embeddings=[embedding],
+                n_results=limit,
+                where={'namespace': {'$in': namespaces}},
+                include=['documents', 'distances']
+            )
+
+        return list(zip(result['documents'][0], result['distances'][0]))
+
+    def delete(self, embeddings_model: str, namespace: str) -> None:
+        collection = self._get_collection(embeddings_model)
+        with self._lock:
+            collection.delete(where={'namespace': namespace})
+
+    def _get_collection(self, embeddings_model: str) -> Any:
+        with self._lock:
+            if embeddings_model not in self._collections:
+                self._collections[embeddings_model] = self._client.get_or_create_collection(
+                    f'memory-{hashlib.sha256(embeddings_model.encode("utf-8")).hexdigest()[:16]}',
+                    metadata={'hnsw:space': 'cosine', 'embeddings_model': embeddings_model}
+                )
+            return self._collections[embeddings_model]
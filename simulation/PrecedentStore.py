@@ -0,0 +1,100 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+import chromadb
+from chromadb.config import Settings
+
+from crew.models import Precedent
+from state.SingletonMeta import SingletonMeta
+
+
+class PrecedentStore(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        self._client = chromadb.PersistentClient(
+            path=os.getenv('PRECEDENT_PATH', './storage/precedents'),
+            settings=Settings(anonymized_telemetry=False)
+        )
+        self.search_ef = int(os.getenv('PRECEDENT_SEARCH_EF', 64))
+        self._collections: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_case_key(case_description: str) -> str:
+        return hashlib.sha256(case_description.strip().encode('utf-8')).hexdigest()
+
+    def add(self, embeddings_model: str, precedent_id: str, precedent: Precedent, embedding: List[float]) -> None:
+        collection = self._get_collection(embeddings_model)
+        metadata = {
+            'case_key': self.get_case_key(precedent.case_description),
+            'court_type': precedent.court_type,
+            'arguments': precedent.arguments,
+            'verdict': precedent.verdict,
+            'created_at': time.time()
+        }
+        if precedent.jury_verdict is not None:
+            metadata['jury_verdict'] = precedent.jury_verdict
+
+        with self._lock:
+            collection.upsert(
+                ids=[precedent_id],
+                documents=[precedent.case_description],
+                embeddings=[embedding],
+                metadatas=[metadata]
+            )
+
+    def search(self,
+               embeddings_model: str,
+               embedding: List[float],
+               limit: int,
+               exclude_case_key: str | None = None
+               ) -> List[Tuple[Precedent, float]]:
+        collection = self._get_collection(embeddings_model)
+        with self._lock:
+            count = collection.count()
+            if count == 0:
+                return []
+            result = collection.query(
+                query_embeddings=[embedding],
+                n_results=min(limit * 4, count),
+                include=['documents', 'metadatas', 'distances']
+            )
+
+        precedents = []
+        seen_case_keys = {exclude_case_key}
+        for document, metadata, distance in zip(result['documents'][0], result['metadatas'][0], result['distances'][0]):
+            if metadata['case_key'] in seen_case_keys:
+                continue
+            seen_case_keys.add(metadata['case_key'])
+            precedents.append((
+                Precedent(
+                    case_description=document,
+                    court_type=metadata['court_type'],
+                    arguments=metadata['arguments'],
+                    verdict=metadata['verdict'],
+                    jury_verdict=metadata.get('jury_verdict')
+                ),
+                distance
+            ))
+
+        return precedents[:limit]
+
+    def count(self, embeddings_model: str) -> int:
+        collection = self._get_collection(embeddings_model)
+        with self._lock:
+            return collection.count()
+
+    def _get_collection(self, embeddings_model: str) -> Any:
+        with self._lock:
+            if embeddings_model not in self._collections:
+                self._collections[embeddings_model] = self._client.get_or_create_collection(
+                    f'precedents-{hashlib.sha256(embeddings_model.encode("utf-8")).hexdigest()[:16]}',
+                    metadata={
+                        'hnsw:space': 'cosine',
+                        'hnsw:search_ef': self.search_ef,
+                        'embeddings_model': embeddings_model
+                    }
+                )
+            return self._collections[embeddings_model]
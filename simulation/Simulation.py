@@ -0,0 +1,86 @@
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Callable, Dict, List
+
+from enums.AgentPurpose import AgentPurpose
+from enums.SimulationStatus import SimulationStatus
+from exceptions.SimulationCancelledException import SimulationCancelledException
+from simulation.HearingMetrics import HearingMetrics
+from simulation.TraceBuffer import TraceBuffer
+from simulation.Transcript import Transcript
+
+logger = logging.getLogger(__name__)
+
+
+class Simulation:
+    id: str
+    status: SimulationStatus
+    result: Any
+    error: str | None
+    traces: TraceBuffer
+    metrics: HearingMetrics
+
+    def __init__(self) -> None:
+        self.id = str(uuid.uuid4())
+        self.status = SimulationStatus.QUEUED
+        self.result = None
+        self.error = None
+        self.traces = TraceBuffer(int(os.getenv('TRACE_BUFFER_CAPACITY', 100)))
+        self.metrics = HearingMetrics()
+        self._transcripts: Dict[AgentPurpose, Transcript] = {purpose: Transcript() for purpose in AgentPurpose}
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._finish_callbacks: List[Callable[['Simulation'], None]] = []
+
+    def add_message(self, agent_purpose: AgentPurpose, content: str) -> None:
+        self._transcripts[agent_purpose].append(content)
+
+    def get_messages(self, agent_purpose: AgentPurpose) -> List[str]:
+        return self._transcripts[agent_purpose].read()
+
+    def get_transcript(self, agent_purpose: AgentPurpose) -> Transcript:
+        return self._transcripts[agent_purpose]
+
+    def append_draft(self, agent_purpose: AgentPurpose, token: str) -> None:
+        self._transcripts[agent_purpose].append_draft(token)
+
+    def clear_draft(self, agent_purpose: AgentPurpose) -> None:
+        self._transcripts[agent_purpose].clear_draft()
+
+    def get_draft(self, agent_purpose: AgentPurpose) -> str:
+        return self._transcripts[agent_purpose].get_draft()
+
+    def set_status(self, status: SimulationStatus, error: str | None = None) -> None:
+        with self._lock:
+            self.status = status
+            self.error = error
+
+    def is_active(self) -> bool:
+        return self.status in SimulationStatus.get_active()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def add_finish_callback(self, callback: Callable[['Simulation'], None]) -> None:
+        self._finish_callbacks.append(callback)
+
+    def run_finish_callbacks(self) -> None:
+        callbacks, self._finish_callbacks = self._finish_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                logger.exception('Finish callback of simulation %s failed', self.id)
+        try:
+            self.traces.release(self.id)
+        except Exception:
+            logger.exception('Releasing traces of simulation %s failed', self.id)
+
+    def raise_if_cancelled(self) -> None:
+        if self.is_cancelled():
+            raise SimulationCancelledException(self.id)
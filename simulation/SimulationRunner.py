@@ -0,0 +1,66 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from enums.SimulationStatus import SimulationStatus
+from exceptions.SimulationCancelledException import SimulationCancelledException
+from simulation.Simulation import Simulation
+from state.SingletonMeta import SingletonMeta
+
+
+class SimulationRunner(metaclass=SingletonMeta):
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('MAX_CONCURRENT_SIMULATIONS', 4)),
+            thread_name_prefix='simulation'
+        )
+        self._simulations: OrderedDict[str, Simulation] = OrderedDict()
+        self._max_retained = int(os.getenv('MAX_RETAINED_SIMULATIONS', 100))
+        self._lock = threading.Lock()
+
+    def submit(self, simulation: Simulation, job: Callable[[], Any]) -> Simulation:
+        with self._lock:
+            self._simulations[simulation.id] = simulation
+        self._executor.submit(self._run, simulation, job)
+
+        return simulation
+
+    def get(self, simulation_id: str | None) -> Simulation | None:
+        with self._lock:
+            return self._simulations.get(simulation_id)
+
+    def cancel(self, simulation_id: str | None) -> None:
+        simulation = self.get(simulation_id)
+        if simulation is not None:
+            simulation.cancel()
+
+    def remove(self, simulation_id: str | None) -> None:
+        self.cancel(simulation_id)
+        with self._lock:
+            self._simulations.pop(simulation_id, None)
+
+    def _run(self, simulation: Simulation, job: Callable[[], Any]) -> None:
+        try:
+            if simulation.is_cancelled():
+                simulation.set_status(SimulationStatus.CANCELLED)
+                return
+
+            simulation.set_status(SimulationStatus.RUNNING)
+            simulation.result = job()
+            simulation.set_status(SimulationStatus.FINISHED)
+        except SimulationCancelledException:
+            simulation.set_status(SimulationStatus.CANCELLED)
+        except Exception as e:
+            simulation.set_status(SimulationStatus.FAILED, str(e))
+        finally:
+            simulation.run_finish_callbacks()
+            self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        with self._lock:
+            finished = [simulation_id for simulation_id, simulation in self._simulations.items()
+                        if not simulation.is_active()]
+            for simulation_id in finished[:max(len(finished) - self._max_retained, 0)]:
+                del self._simulations[simulation_id]
@@ -0,0 +1,45 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List
+
+if TYPE_CHECKING:
+    from langchain_core.agents import AgentFinish
+
+
+class TraceBuffer:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.dropped = 0
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def append(self, agent_finish: 'AgentFinish') -> None:
+        with self._lock:
+            if len(self._traces) == self.capacity:
+                self.dropped += 1
+            self._traces.append({
+                'timestamp': time.time(),
+                'output': agent_finish.return_values.get('output'),
+                'log': agent_finish.log
+            })
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._traces)
+
+    def release(self, simulation_id: str) -> None:
+        directory = os.getenv('TRACE_PERSIST_DIR')
+        with self._lock:
+            if directory and self._traces:
+                os.makedirs(directory, exist_ok=True)
+                with open(os.path.join(directory, f'{simulation_id}.jsonl'), 'w', encoding='utf-8') as trace_file:
+                    for trace in self._traces:
+                        trace_file.write(json.dumps(trace, ensure_ascii=False, default=str) + '\n')
+            self._traces.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._traces)
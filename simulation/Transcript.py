@@ -0,0 +1,34 @@
+import threading
+from typing import List
+
+
+class Transcript:
+    def __init__(self) -> None:
+        self._messages: List[str] = []
+        self._draft: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._messages)
+
+    def append(self, content: str) -> None:
+        with self._lock:
+            self._messages.append(content)
+            self._draft = []
+
+    def read(self, start: int = 0, end: int | None = None) -> List[str]:
+        with self._lock:
+            return self._messages[start:end]
+
+    def append_draft(self, token: str) -> None:
+        with self._lock:
+            self._draft.append(token)
+
+    def clear_draft(self) -> None:
+        with self._lock:
+            self._draft = []
+
+    def get_draft(self) -> str:
+        with self._lock:
+            return ''.join(self._draft)
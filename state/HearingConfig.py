@@ -0,0 +1,81 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from enums.AgentPurpose import AgentPurpose
+from enums.AiModel import AiModel
+from enums.AiProvider import AiProvider
+from enums.CourtCaseType import CourtCaseType
+from state.AppState import AppState
+
+
+class AgentConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, protected_namespaces=())
+
+    model: AiModel
+    temperature: Optional[float] = None
+
+
+class HearingConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    case_description: str
+    court_type: CourtCaseType
+    supervisor: AgentConfig
+    judge: AgentConfig
+    witness: AgentConfig
+    defense: AgentConfig
+    prosecutor: AgentConfig
+    jury: Optional[AgentConfig] = None
+    juries_amount: int = 1
+    hearing_script: Optional[str] = None
+    openai_key: Optional[str] = Field(default=None, exclude=True, repr=False)
+    anthropic_key: Optional[str] = Field(default=None, exclude=True, repr=False)
+
+    def get_agent(self, agent_purpose: AgentPurpose) -> AgentConfig:
+        return getattr(self, AgentPurpose.get_settings_key(agent_purpose))
+
+    def get_api_key(self, provider: AiProvider | None) -> Optional[str]:
+        match provider:
+            case AiProvider.OPEN_AI:
+                return self.openai_key
+            case AiProvider.ANTHROPIC:
+                return self.anthropic_key
+            case _:
+                return None
+
+    def config_hash(self) -> str:
+        return hashlib.sha256(self.model_dump_json().encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], **overrides: Any) -> 'HearingConfig':
+        values = {**settings, **overrides}
+        court_type = values.get('court_type') or CourtCaseType.CIVIL
+        agents = {}
+        for agent_purpose in AgentPurpose:
+            settings_key = AgentPurpose.get_settings_key(agent_purpose)
+            if values.get(f'{settings_key}_model') is not None:
+                agents[settings_key] = AgentConfig(
+                    model=values[f'{settings_key}_model'],
+                    temperature=values.get(f'{settings_key}_temperature')
+                )
+
+        return cls(
+            case_description=values.get('case_description') or '',
+            court_type=court_type if isinstance(court_type, CourtCaseType) else CourtCaseType.get_by_name(court_type),
+            juries_amount=values.get('juries_amount') or 1,
+            hearing_script=values.get('hearing_script') or None,
+            openai_key=values.get('openai_key') or None,
+            anthropic_key=values.get('anthropic_key') or None,
+            **agents
+        )
+
+    @classmethod
+    def from_app_state(cls) -> 'HearingConfig':
+        keys = ['case_description', 'court_type', 'juries_amount', 'openai_key', 'anthropic_key']
+        for agent_purpose in AgentPurpose:
+            settings_key = AgentPurpose.get_settings_key(agent_purpose)
+            keys.extend([f'{settings_key}_model', f'{settings_key}_temperature'])
+
+        return cls.from_settings({key: AppState.get_value(key) for key in keys})
@@ -0,0 +1,37 @@
+import unittest
+
+from enums.Verdict import Verdict
+
+
+class VerdictFromVoteTest(unittest.TestCase):
+    def test_reads_the_vote_line(self) -> None:
+        self.assertEqual(Verdict.GUILTY, Verdict.from_vote('The evidence is convincing.\nVOTE: GUILTY'))
+        self.assertEqual(Verdict.NOT_GUILTY, Verdict.from_vote('The timeline was not proven.\nVOTE: NOT_GUILTY'))
+        self.assertEqual(Verdict.UNDECIDED, Verdict.from_vote('I cannot decide.\nVOTE: UNDECIDED'))
+
+    def test_accepts_formatting_variants(self) -> None:
+        self.assertEqual(Verdict.NOT_GUILTY, Verdict.from_vote('Reasons.\n**vote: not guilty**\n'))
+        self.assertEqual(Verdict.NOT_GUILTY, Verdict.from_vote('Reasons.\nVOTE: Not-Guilty.'))
+        self.assertEqual(Verdict.GUILTY, Verdict.from_vote('Reasons.\n  VOTE:GUILTY  \n\n'))
+
+    def test_ignores_negated_phrasing_in_the_statement(self) -> None:
+        self.assertEqual(Verdict.NOT_GUILTY, Verdict.from_vote('I am not convinced he is guilty.\nVOTE: NOT_GUILTY'))
+        self.assertEqual(Verdict.UNDECIDED, Verdict.from_vote('I am not convinced he is guilty.'))
+
+    def test_ignores_mixed_phrasing_in_the_statement(self) -> None:
+        statement = 'The defence claims he is not guilty, but I find him guilty.'
+        self.assertEqual(Verdict.GUILTY, Verdict.from_vote(f'{statement}\nVOTE: GUILTY'))
+        self.assertEqual(Verdict.UNDECIDED, Verdict.from_vote(statement))
+
+    def test_only_the_last_line_counts(self) -> None:
+        self.assertEqual(Verdict.UNDECIDED, Verdict.from_vote('VOTE: GUILTY\nOn second thought I am unsure.'))
+        self.assertEqual(Verdict.NOT_GUILTY, Verdict.from_vote('VOTE: GUILTY\nVOTE: NOT_GUILTY'))
+
+    def test_rejects_malformed_votes(self) -> None:
+        self.assertEqual(Verdict.UNDECIDED, Verdict.from_vote(''))
+        self.assertEqual(Verdict.UNDECIDED, Verdict.from_vote('VOTE: probably guilty'))
+        self.assertEqual(Verdict.UNDECIDED, Verdict.from_vote('VOTE: GUILTY or NOT_GUILTY'))
+
+
+if __name__ == '__main__':
+    unittest.main()
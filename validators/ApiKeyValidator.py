@@ -1,49 +1,116 @@
+import hashlib
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Tuple
 
-import anthropic
-import openai
-from anthropic import Anthropic
+from enums.AiProvider import AiProvider
+
+key_check = Callable[[str, float], Tuple[str | None, bool]]
 
 
 class ApiKeyValidator:
+    _results: Dict[str, Tuple[str | None, float]] = {}
+    _lock = threading.Lock()
+    _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='api-key-validator')
 
-    @staticmethod
-    def is_valid_open_ai_key(key: str) -> str | None:
+    @classmethod
+    def is_valid_open_ai_key(cls, key: str) -> str | None:
+        return cls.validate_keys({AiProvider.OPEN_AI: key})
+
+    @classmethod
+    def is_valid_anthropic_key(cls, key: str) -> str | None:
+        return cls.validate_keys({AiProvider.ANTHROPIC: key})
+
+    @classmethod
+    def validate_keys(cls, keys: Dict[AiProvider, str]) -> str | None:
         if os.getenv('APP_ENV') == 'debug':
             return None
 
-        client = openai.OpenAI(api_key=key)
+        checks: Dict[AiProvider, key_check] = {
+            AiProvider.OPEN_AI: cls._check_open_ai_key,
+            AiProvider.ANTHROPIC: cls._check_anthropic_key
+        }
+        timeout = float(os.getenv('API_KEY_VALIDATION_TIMEOUT', 5))
+        messages: Dict[AiProvider, str | None] = {}
+        futures: Dict[AiProvider, Future] = {}
+        for provider, key in keys.items():
+            if key == '' or provider not in checks:
+                continue
+
+            cached = cls._get_cached(provider, key)
+            if cached is not None:
+                messages[provider] = cached[0]
+            else:
+                futures[provider] = cls._executor.submit(checks[provider], key, timeout)
+
+        wait(futures.values(), timeout=timeout)
+        for provider, future in futures.items():
+            if not future.done():
+                messages[provider] = f'Error({provider.value}): API key validation timed out, try again'
+                continue
+
+            try:
+                message, cacheable = future.result()
+            except Exception:
+                messages[provider] = f'Error({provider.value}): API key could not be verified, try again'
+                continue
+
+            messages[provider] = message
+            if cacheable:
+                cls._set_cached(provider, keys[provider], message)
+
+        return next((messages[provider] for provider in keys if messages.get(provider) is not None), None)
+
+    @staticmethod
+    def _check_open_ai_key(key: str, timeout: float) -> Tuple[str | None, bool]:
+        import openai
+
+        client = openai.OpenAI(api_key=key, timeout=timeout, max_retries=0)
         try:
             client.models.list()
-            return None
+            return None, True
         except openai.APIError as e:
+            cacheable = isinstance(e, (openai.AuthenticationError, openai.PermissionDeniedError))
             if isinstance(e.body, dict):
-                message = f'Error(OpenAI): {e.body['message']}'
-                return message
+                return f'Error(OpenAI): {e.body['message']}', cacheable
 
-            return 'Error(OpenAI): Unknown API error'
+            return 'Error(OpenAI): Unknown API error', cacheable
 
     @staticmethod
-    def is_valid_anthropic_key(key: str) -> str | None:
-        if os.getenv('APP_ENV') == 'debug':
-            return None
+    def _check_anthropic_key(key: str, timeout: float) -> Tuple[str | None, bool]:
+        import anthropic
+        import httpx
 
-        client = Anthropic(api_key=key)
+        client = anthropic.Anthropic(api_key=key, timeout=timeout, max_retries=0)
         try:
-            client.messages.create(
-                max_tokens=1,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": "Test",
-                    }
-                ],
-                model="claude-instant-1.2",
-            )
-            return None
+            client.get('/v1/models', cast_to=httpx.Response)
+            return None, True
         except anthropic.APIError as e:
+            cacheable = isinstance(e, (anthropic.AuthenticationError, anthropic.PermissionDeniedError))
             if isinstance(e.body, dict):
-                message = f'Error(Anthropic): {e.body['error']['message']}'
-                return message
+                return f'Error(Anthropic): {e.body['error']['message']}', cacheable
 
-            return 'Error(Anthropic): Unknown API error'
+            return 'Error(Anthropic): Unknown API error', cacheable
+
+    @classmethod
+    def _get_cached(cls, provider: AiProvider, key: str) -> Tuple[str | None, float] | None:
+        cache_key = cls._get_cache_key(provider, key)
+        with cls._lock:
+            cached = cls._results.get(cache_key)
+            if cached is not None and cached[1] < time.time():
+                del cls._results[cache_key]
+                return None
+
+            return cached
+
+    @classmethod
+    def _set_cached(cls, provider: AiProvider, key: str, message: str | None) -> None:
+        expires_at = time.time() + float(os.getenv('API_KEY_VALIDATION_TTL', 3600))
+        with cls._lock:
+            cls._results[cls._get_cache_key(provider, key)] = (message, expires_at)
+
+    @staticmethod
+    def _get_cache_key(provider: AiProvider, key: str) -> str:
+        return hashlib.sha256(f'{provider.value}:{key}'.encode('utf-8')).hexdigest()